@@ -0,0 +1,160 @@
+"""
+Pipeline benchmark for cyberdatagen
+-------------------------------------------------------------------------------
+Times every stage of cybersecurity_data_pipeline (normal and anomalous generation,
+concat, color mapping, one save per output format, summary and ZIP) for a range
+of row counts. Each row count runs in a fresh interpreter so that its peak RSS is
+its own. Reports seconds, rows/sec and peak RSS per stage as JSON and, given a
+baseline report, fails when a stage got slower than the tolerance allows.
+
+Usage:
+    python benchmarks/bench_pipeline.py [--rows 1000,10000,100000,1000000,10000000]
+                                        [--formats csv,parquet] [--output bench.json]
+                                        [--baseline benchmarks/baseline.json] [--save-baseline]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(REPO_ROOT, "benchmarks", "baseline.json")
+
+
+def peak_rss_mb():
+    """High-water mark of this process' resident memory in MB (ru_maxrss is KB on Linux, bytes on macOS)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def run_stages(rows, formats, seed, workdir):
+    """Runs the pipeline stages on `rows` rows in this process and returns their measurements."""
+    sys.path.insert(0, REPO_ROOT)
+    import pandas as pd
+    from cyberdatagen import DataConfig, DataGenerator, DataProcessor, DataSaver
+
+    num_anomalous = rows // 5
+    config = DataConfig(seed=seed, num_normal_issues=rows - num_anomalous, num_anomalous_issues=num_anomalous,
+                        github_repo_folder=workdir)
+    generator = DataGenerator(config)
+    processor = DataProcessor(config)
+    saver = DataSaver(config.parquet_compression, config.parquet_compression_level, config.row_group_size)
+    stages = {}
+
+    @contextlib.contextmanager
+    def stage(name, stage_rows):
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield stages.setdefault(name, {})
+        seconds = time.perf_counter() - started
+        stages[name].update({"rows": stage_rows, "seconds": round(seconds, 6),
+                             "rows_per_second": round(stage_rows / seconds) if seconds > 0 else None,
+                             "peak_rss_mb": round(peak_rss_mb(), 1)})
+
+    with stage("generate_normal", config.num_normal_issues):
+        normal_df = generator.generate_normal_issues_df(*generator._issue_ids(0, config.num_normal_issues))
+        normal_df["Is Anomaly"] = generator._is_anomaly_column(len(normal_df), 0)
+    with stage("generate_anomalous", config.num_anomalous_issues):
+        anomaly_df = generator.generate_anomalous_issues_df(
+            *generator._issue_ids(0, config.num_anomalous_issues, anomalous=True))
+        anomaly_df["Is Anomaly"] = generator._is_anomaly_column(len(anomaly_df), 1)
+    with stage("concat", rows):
+        combined_df = pd.concat([normal_df, anomaly_df], ignore_index=True)
+    with stage("color_map", rows):
+        combined_df = processor.map_threat_severity_to_color(combined_df)
+
+    saved = []
+    for file_format in formats:
+        path = os.path.join(workdir, f"cybersecurity_dataset_combined.{file_format}")
+        with stage(f"save_{file_format}", rows) as measurement:
+            saver.save_dataframe(combined_df, path)
+        measurement["bytes"] = os.path.getsize(path)
+        saved.append(path)
+    with stage("print_summary", rows):
+        saver.print_summary(saved)
+    with stage("zip", rows) as measurement:
+        saver.write_archive(config.zip_file, saved, compression=config.zip_compression)
+    measurement["bytes"] = os.path.getsize(config.zip_file)
+
+    return {"rows": rows, "stages": stages, "total_seconds": round(sum(s["seconds"] for s in stages.values()), 6),
+            "peak_rss_mb": round(peak_rss_mb(), 1)}
+
+
+def measure(rows, formats, seed):
+    """Runs one row count in a fresh interpreter (and a temporary output folder)."""
+    with tempfile.TemporaryDirectory(prefix="cyberdatagen-bench-") as workdir:
+        completed = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", str(rows),
+                                    "--formats", ",".join(formats), "--seed", str(seed), "--workdir", workdir],
+                                   cwd=REPO_ROOT, check=True, capture_output=True, text=True)
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def compare(report, baseline, tolerance, min_seconds):
+    """
+    Lists the stages that are more than `tolerance` slower than in the baseline report.
+    Stages faster than min_seconds in the baseline are ignored as timer noise.
+    """
+    previous = {(result["rows"], name): stage for result in baseline["results"]
+                for name, stage in result["stages"].items()}
+    regressions = []
+    for result in report["results"]:
+        for name, stage in result["stages"].items():
+            before = previous.get((result["rows"], name))
+            if before is None or before["seconds"] < min_seconds:
+                continue
+            ratio = stage["seconds"] / before["seconds"]
+            if ratio > 1 + tolerance:
+                regressions.append({"rows": result["rows"], "stage": name, "baseline_seconds": before["seconds"],
+                                    "seconds": stage["seconds"], "ratio": round(ratio, 3)})
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="cyberdatagen pipeline benchmark")
+    parser.add_argument("--rows", default="1000,10000,100000,1000000",
+                        help="Comma-separated row counts (add 10000000 for the large run)")
+    parser.add_argument("--formats", default="csv,parquet,feather,arrow", help="Comma-separated output formats to save")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the generated data")
+    parser.add_argument("--output", default=None, help="Optional JSON report path")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline report to compare against, if it exists")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this report as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown per stage (0.25 = 25%%)")
+    parser.add_argument("--min-seconds", type=float, default=0.05, help="Ignore stages faster than this in the baseline")
+    parser.add_argument("--child", type=int, default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--workdir", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    formats = [f for f in args.formats.split(",") if f]
+
+    if args.child is not None:
+        print(json.dumps(run_stages(args.child, formats, args.seed, args.workdir)))
+        return 0
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "formats": formats,
+        "results": [measure(int(rows), formats, args.seed) for rows in args.rows.split(",") if rows],
+    }
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            report["regressions"] = compare(report, json.load(f), args.tolerance, args.min_seconds)
+
+    print(json.dumps(report, indent=2))
+    for path in [args.output] + ([args.baseline] if args.save_baseline else []):
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+    return 1 if report.get("regressions") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
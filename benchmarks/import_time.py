@@ -0,0 +1,70 @@
+"""
+Import-time benchmark for cyberdatagen
+-------------------------------------------------------------------------------
+Imports cyberdatagen in fresh interpreters, reports the best/median wall time and
+fails when the median exceeds the startup budget or when a plotting/display
+library was imported eagerly.
+
+Usage:
+    python benchmarks/import_time.py [--runs 5] [--budget 1.0] [--output import_time.json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules only needed by DataDisplay / the EDA pipeline; a plain import must not load them
+LAZY_MODULES = ["matplotlib", "seaborn", "sklearn", "IPython", "google.colab", "synthetic_data_plot"]
+
+PROBE = (
+    "import json, sys, time\n"
+    "started = time.perf_counter()\n"
+    "import cyberdatagen\n"
+    "elapsed = time.perf_counter() - started\n"
+    "print(json.dumps({'seconds': elapsed, 'loaded': [m for m in %r if m in sys.modules]}))\n"
+) % (LAZY_MODULES,)
+
+
+def measure_import(runs):
+    """Imports cyberdatagen in `runs` fresh interpreters and returns the per-run probe results."""
+    results = []
+    for _ in range(runs):
+        completed = subprocess.run([sys.executable, "-c", PROBE], cwd=REPO_ROOT, check=True,
+                                   capture_output=True, text=True)
+        results.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="cyberdatagen import-time benchmark")
+    parser.add_argument("--runs", type=int, default=5, help="Number of fresh interpreters")
+    parser.add_argument("--budget", type=float, default=1.0, help="Maximum median import time in seconds")
+    parser.add_argument("--output", default=None, help="Optional JSON report path")
+    args = parser.parse_args()
+
+    results = measure_import(args.runs)
+    timings = [result["seconds"] for result in results]
+    eager = sorted({module for result in results for module in result["loaded"]})
+    report = {
+        "runs": args.runs,
+        "best_seconds": min(timings),
+        "median_seconds": statistics.median(timings),
+        "budget_seconds": args.budget,
+        "eagerly_loaded": eager,
+    }
+    report["passed"] = report["median_seconds"] <= args.budget and not eager
+
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 0 if report["passed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,178 +13,436 @@ Author: Atsu Vovor
 """
 
 import os
-import shutil
+import io
+import json
+import time
+import uuid
+import hashlib
 import zipfile
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
-from IPython.display import display
 import argparse
-import random
+import logging
+import contextlib
+import dataclasses
+from dataclasses import dataclass, field, fields
+from functools import cached_property
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 import warnings
 warnings.filterwarnings("ignore")
-# Try to import Colab-specific files.download (ignored if not available)
 try:
-    from google.colab import files
-    COLAB = True
+    import resource  # Unix only; peak RSS is not reported elsewhere
 except ImportError:
-    COLAB = False
+    resource = None
+
+logger = logging.getLogger("cyberdatagen")
+
+# Plotting/EDA (synthetic_data_plot: matplotlib, seaborn, sklearn), IPython display and
+# Colab helpers are imported on first use, so headless generation runs do not pay for them.
+def _colab_files():
+    """Returns Colab's files module (for files.download), or None when not running in Colab."""
+    try:
+        from google.colab import files
+    except ImportError:
+        return None
+    return files
+
+
+def __getattr__(name):
+    # Lazily resolved module attributes, kept for code that imported them from here
+    if name == "explaratory_data_analysis_pipeline":
+        from synthetic_data_plot import explaratory_data_analysis_pipeline
+        return explaratory_data_analysis_pipeline
+    if name == "display":
+        from IPython.display import display
+        return display
+    if name == "COLAB":
+        return _colab_files() is not None
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-from  synthetic_data_plot import explaratory_data_analysis_pipeline
 # =====================================================================
 # Configuration
 # =====================================================================
+@dataclass(frozen=True)
 class DataConfig:
-    def __init__(self):
-        # ------------------ Parameters ------------------
-        self.num_normal_issues = 800
-        self.num_anomalous_issues = 200
-        self.total_issues = self.num_normal_issues + self.num_anomalous_issues
-        self.num_users = 100
-        self.num_reporters = 10
-        self.num_assignees = 20
-        self.num_departments = 5
-        self.current_date = datetime.now()
-        self.start_date = datetime(2023, 1, 1)
-        self.end_date = datetime(self.current_date.year, self.current_date.month, self.current_date.day)
-
-        # ------------------ Paths ------------------
-        self.github_repo_folder = "/content/CyberThreat_Insight/cybersecurity_data"
-        os.makedirs(self.github_repo_folder, exist_ok=True)
-
-        self.normal_data_file = os.path.join(self.github_repo_folder, "cybersecurity_dataset_normal.csv")
-        self.anomalous_data_file = os.path.join(self.github_repo_folder, "cybersecurity_dataset_anomalous.csv")
-        self.combined_data_file = os.path.join(self.github_repo_folder, "cybersecurity_dataset_combined.csv")
-        self.key_threat_indicators_file = os.path.join(self.github_repo_folder, "key_threat_indicators.csv")
-        self.scenarios_with_colors_file = os.path.join(self.github_repo_folder, "scenarios_with_colors.csv")
-        self.zip_file = os.path.join(self.github_repo_folder, "cybersecurity_data.zip")
-
-        # ------------------ Metadata ------------------
-        self.issue_ids = [f"ISSUE-{i:04d}" for i in range(1, self.num_normal_issues + 1)]
-        self.issue_keys = [f"KEY-{i:04d}" for i in range(1, self.num_normal_issues + 1)]
-
-        self.KPI_list = [
-            "Network Security","Access Control","System Vulnerability",
-            "Penetration Testing Effectiveness","Management Oversight",
-            "Procurement Security", "Control Effectiveness",
-            "Asset Inventory Accuracy", "Vulnerability Remediation",
-            "Risk Management Maturity", "Risk Assessment Coverage"
+    """
+    Immutable, picklable generation settings.
+
+    Construction only stores the fields below: directories are created by DataSaver
+    when something is written, and the ID lists, name lists and the KTI/scenario
+    DataFrames are built on first access. Configs can be layered from a JSON file,
+    environment variables (CYBERDATAGEN_<FIELD>) and explicit overrides with
+    DataConfig.load(), and hashed or compared by value.
+    """
+    # ------------------ Parameters ------------------
+    num_normal_issues: int = 800
+    num_anomalous_issues: int = 200
+    num_users: int = 100
+    num_reporters: int = 10
+    num_assignees: int = 20
+    # The first num_departments of department_names, then "Department <n>"
+    num_departments: int = 8
+    start_date: datetime = datetime(2023, 1, 1)
+    # Defaults to the day of current_date
+    end_date: datetime = None
+    # Reference "now" of the resolution dates of open issues. Defaults to the day of end_date
+    # (else today), so equal settings compare, hash and - with a seed - generate equally
+    current_date: datetime = None
+    # Intensity profile of normal report dates: relative volume growth from start_date to
+    # end_date, and weights per day of week (Monday first) and per hour of day
+    volume_trend: float = 0.25
+    weekday_weights: tuple = (1.0, 1.0, 1.0, 1.0, 1.5, 1.5, 1.0)
+    hour_weights: tuple = (1.0,) * 9 + (1.5,) * 3 + (1.0,) * 12
+    # Master seed of all sampling (profile tables, rows, date jitter); None draws fresh entropy
+    seed: int = None
+    # Compute the Color column inside the generators instead of a separate pass over the combined data
+    color_in_generator: bool = False
+    # Emit category dtypes for the label columns and downcast the numeric columns (see
+    # DataGenerator.compact_column_dtypes); False keeps object strings and int64/float64
+    compact_dtypes: bool = True
+    # Issue IDs/keys are prefix + zero-padded number; the width defaults to the digits of the
+    # last number (at least 4), so IDs stay unique and sort in order at any row count
+    issue_id_prefix: str = "ISSUE-"
+    issue_key_prefix: str = "KEY-"
+    issue_id_width: int = None
+    # Number of the first issue, e.g. to continue the numbering of an earlier dataset
+    first_issue_number: int = 1
+    # One of output_formats; also the file extension of the outputs
+    output_format: str = "csv"
+    # One of layouts: "files" writes normal/anomalous/combined files, "partitioned" writes the
+    # combined rows once as a Hive-style dataset (month=/day=/is_anomaly=) under dataset_dir
+    layout: str = "files"
+    # Parquet options: compression codec/level and rows per row group
+    parquet_compression: str = "zstd"
+    parquet_compression_level: int = None
+    row_group_size: int = 100_000
+    # ZIP archive options: "deflate", "stored", "bzip2", "lzma" or "zstd" (Python 3.14+) and its level
+    zip_compression: str = "deflate"
+    zip_compression_level: int = None
+
+    # ------------------ Paths ------------------
+    github_repo_folder: str = "/content/CyberThreat_Insight/cybersecurity_data"
+    # Unique per run (not part of equality/hash), so concurrent pipeline runs never write to the same archive
+    run_id: str = field(default=None, compare=False)
+
+    # Supported output formats and layouts
+    output_formats = ["csv", "parquet", "feather", "arrow"]
+    layouts = ["files", "partitioned"]
+    env_prefix = "CYBERDATAGEN_"
+
+    def __post_init__(self):
+        if self.output_format not in self.output_formats:
+            raise ValueError(f"Unsupported output format {self.output_format!r}, expected one of {self.output_formats}")
+        if self.layout not in self.layouts:
+            raise ValueError(f"Unsupported layout {self.layout!r}, expected one of {self.layouts}")
+        if len(self.weekday_weights) != 7 or len(self.hour_weights) != 24:
+            raise ValueError("weekday_weights needs 7 values and hour_weights 24 values")
+        if self.issue_id_width is not None and len(str(self.last_issue_number)) > self.issue_id_width:
+            # e.g. incremental runs keep the width of the first run; wider IDs would sort before narrower ones
+            raise ValueError(f"Issue number {self.last_issue_number} does not fit issue_id_width={self.issue_id_width}: "
+                             f"the IDs would no longer sort in order. Regenerate the dataset with a larger issue_id_width.")
+        now = datetime.now()
+        if self.current_date is None:
+            day = self.end_date or now
+            object.__setattr__(self, "current_date", datetime(day.year, day.month, day.day))
+        if self.end_date is None:
+            object.__setattr__(self, "end_date", datetime(self.current_date.year, self.current_date.month, self.current_date.day))
+        if self.run_id is None:
+            object.__setattr__(self, "run_id", f"{now:%Y%m%d-%H%M%S}-{uuid.uuid4().hex[:8]}")
+
+    # ------------------ Loading / serialization ------------------
+    @classmethod
+    def _coerce(cls, name, value):
+        """Converts a JSON or environment value to the type of field `name`."""
+        field_type = {f.name: f.type for f in fields(cls)}[name]
+        if value is None or isinstance(value, field_type):
+            return value
+        if isinstance(value, str) and value.strip().lower() in ("", "none", "null"):
+            return None
+        if field_type is bool:
+            return str(value).strip().lower() in ("1", "true", "yes", "on")
+        if field_type is datetime:
+            return datetime.fromisoformat(value)
+        if field_type is tuple and isinstance(value, str):
+            return tuple(float(v) for v in value.split(","))
+        return field_type(value)
+
+    @classmethod
+    def from_dict(cls, values):
+        """Builds a config from a mapping of field names to (JSON-compatible) values."""
+        names = {f.name for f in fields(cls)}
+        unknown = set(values) - names
+        if unknown:
+            raise ValueError(f"Unknown DataConfig fields: {sorted(unknown)}")
+        return cls(**{name: cls._coerce(name, value) for name, value in values.items()})
+
+    @classmethod
+    def from_env(cls, environ=None):
+        """Returns the field overrides found in CYBERDATAGEN_<FIELD> environment variables."""
+        environ = os.environ if environ is None else environ
+        return {f.name: environ[cls.env_prefix + f.name.upper()]
+                for f in fields(cls) if cls.env_prefix + f.name.upper() in environ}
+
+    @classmethod
+    def load(cls, config_file=None, overrides=None, use_env=True):
+        """
+        Layers defaults < JSON config file < environment variables < explicit overrides.
+
+        Args:
+            config_file (str, optional): Path of a JSON object of field values.
+            overrides (dict, optional): Field values that take precedence (e.g. from the CLI).
+            use_env (bool): Whether to read CYBERDATAGEN_<FIELD> environment variables.
+
+        Returns:
+            DataConfig: The resulting config.
+        """
+        values = {}
+        if config_file:
+            with open(config_file, encoding="utf-8") as f:
+                values.update(json.load(f))
+        if use_env:
+            values.update(cls.from_env())
+        values.update({name: value for name, value in (overrides or {}).items() if value is not None})
+        return cls.from_dict(values)
+
+    def replace(self, **overrides):
+        """Returns a copy of this config with some fields replaced."""
+        return dataclasses.replace(self, **overrides)
+
+    def to_dict(self):
+        """Returns the fields as JSON-compatible values (dates in ISO format)."""
+        return {f.name: value.isoformat() if isinstance(value, datetime) else value
+                for f in fields(self) for value in [getattr(self, f.name)]}
+
+    def cache_key(self):
+        """Stable digest of the fields that determine the generated data (run_id excluded)."""
+        values = {name: value for name, value in self.to_dict().items() if name != "run_id"}
+        return hashlib.sha256(json.dumps(values, sort_keys=True).encode()).hexdigest()
+
+    def __getstate__(self):
+        # Only the fields travel to worker processes; lazily built lists and DataFrames are rebuilt there
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    # ------------------ Derived values (computed on access) ------------------
+    @property
+    def total_issues(self):
+        return self.num_normal_issues + self.num_anomalous_issues
+
+    def _output_path(self, name):
+        return os.path.join(self.github_repo_folder, f"{name}.{self.output_format}")
+
+    @property
+    def normal_data_file(self):
+        return self._output_path("cybersecurity_dataset_normal")
+
+    @property
+    def anomalous_data_file(self):
+        return self._output_path("cybersecurity_dataset_anomalous")
+
+    @property
+    def combined_data_file(self):
+        return self._output_path("cybersecurity_dataset_combined")
+
+    @property
+    def dataset_dir(self):
+        return os.path.join(self.github_repo_folder, "cybersecurity_dataset")
+
+    @property
+    def key_threat_indicators_file(self):
+        return self._output_path("key_threat_indicators")
+
+    @property
+    def scenarios_with_colors_file(self):
+        return self._output_path("scenarios_with_colors")
+
+    @property
+    def zip_file(self):
+        return os.path.join(self.github_repo_folder, f"cybersecurity_data_{self.run_id}.zip")
+
+    @property
+    def manifest_file(self):
+        return os.path.join(self.github_repo_folder, "manifest.json")
+
+    @property
+    def state_file(self):
+        return os.path.join(self.github_repo_folder, "generator_state.json")
+
+    @property
+    def effective_issue_id_width(self):
+        return self.issue_id_width or max(4, len(str(self.last_issue_number)))
+
+    @property
+    def last_issue_number(self):
+        return self.first_issue_number + self.total_issues - 1
+
+    def format_issue_ids(self, numbers):
+        """
+        Formats issue numbers as IDs and keys in bulk with NumPy string operations.
+
+        Args:
+            numbers (array-like): Integer issue numbers.
+
+        Returns:
+            tuple: (issue IDs, issue keys) as NumPy string arrays.
+        """
+        numbers = np.asarray(numbers, dtype=np.int64)
+        if not numbers.size:
+            # np.char.zfill cannot size an empty array (e.g. a chunk without anomalous rows)
+            empty = np.array([], dtype=str)
+            return empty, empty
+        digits = np.char.zfill(numbers.astype(str), self.effective_issue_id_width)
+        return np.char.add(self.issue_id_prefix, digits), np.char.add(self.issue_key_prefix, digits)
+
+    @cached_property
+    def reporters(self):
+        return [f"Reporter {i}" for i in range(1, self.num_reporters + 1)]
+
+    @cached_property
+    def assignees(self):
+        return [f"Assignee {i}" for i in range(1, self.num_assignees + 1)]
+
+    @cached_property
+    def users(self):
+        return [f"User_{i}" for i in range(1, self.num_users + 1)]
+
+    @cached_property
+    def departments(self):
+        return (self.department_names[:self.num_departments]
+                + [f"Department {i}" for i in range(len(self.department_names) + 1, self.num_departments + 1)])
+
+    @cached_property
+    def ktis_key_threat_indicators_df(self):
+        return pd.DataFrame(self.ktis_data)
+
+    @cached_property
+    def scenarios_with_colors_df(self):
+        return pd.DataFrame(self.scenario_data)
+
+    # ------------------ Metadata ------------------
+
+    KPI_list = [
+        "Network Security","Access Control","System Vulnerability",
+        "Penetration Testing Effectiveness","Management Oversight",
+        "Procurement Security", "Control Effectiveness",
+        "Asset Inventory Accuracy", "Vulnerability Remediation",
+        "Risk Management Maturity", "Risk Assessment Coverage"
+    ]
+    KRI_list = [
+        "Data Breach", "Phishing Attack","Malware","Data Leak",
+        "Legal Compliance","Risk Exposure", "Cloud Security Posture",
+        "Unauthorized Access", "DDOS"
+    ]
+    categories = KPI_list + KRI_list
+    severities = ["Low", "Medium", "High", "Critical"]
+    statuses = ["Open", "In Progress", "Resolved","Closed"]
+    department_names = ["IT", "Finance", "Operations", "HR", "Legal",
+                        "Sales", "C-Suite Executives", "External Contractors"]
+    locations = ["CANADA", "USA", "Unknown", "EU", "DE", "FR", "JP", "CN", "AU", "IN", "UK"]
+
+    columns = [
+        "Issue ID", "Issue Key", "Issue Name", "Issue Volume", "Category",
+        "Severity", "Status", "Reporters", "Assignees", "Date Reported",
+        "Date Resolved", "Issue Response Time Days", "Impact Score", "Risk Level",
+        "Department Affected", "Remediation Steps", "Cost", "KPI/KRI", "User ID",
+        "Timestamps", "Activity Type","User Location", "IP Location",
+        "Session Duration in Second", "Num Files Accessed", "Login Attempts",
+        "Data Transfer MB", "CPU Usage %", "Memory Usage MB", "Threat Score",
+        "Threat Level", "Defense Action"
+    ]
+
+    # ------------------ Extra DataFrames ------------------
+    ktis_data = {
+        "KIT": [
+            "Severity", "Impact Score", "Risk Level", "Response Time", "Category",
+            "Activity Type", "Login Attempts", "Num Files Accessed", "Data Transfer MB",
+            "CPU Usage %", "Memory Usage MB"
+        ],
+        "Condition": [
+            "Critical = 10, High = 8, Medium = 5, Low = 2",
+            "1 to 10 (already a score)",
+            "High = 8, Medium = 5, Low = 2",
+            ">7 days = 5, 3-7 days = 3, <3 days = 1",
+            "Unauthorized Access = 8, Phishing = 6, etc.",
+            "High-risk types (e.g., login, data_transfer)",
+            ">5 = 5, 3-5 = 3, <3 = 1",
+            ">10 = 5, 5-10 = 3, <5 = 1",
+            ">100 MB = 5, 50-100 MB = 3, <50 MB = 1",
+            ">80% = 5, 60-80% = 3, <60% = 1",
+            ">8000 MB = 5, 4000-8000 MB = 3, <4000 MB = 1"
+        ],
+        "Score": [
+            "2 - 10", "1 - 10", "2 - 8", "1 - 5", "1 - 8", "1 - 5", "1 - 5", "1 - 5", "1 - 5", "1 - 5", "1 - 5"
         ]
-        self.KRI_list = [
-            "Data Breach", "Phishing Attack","Malware","Data Leak",
-            "Legal Compliance","Risk Exposure", "Cloud Security Posture",
-            "Unauthorized Access", "DDOS"
+    }
+
+    scenario_data = {
+        "Scenario": list(range(1, 17)),
+        "Threat Level": [
+            "Critical", "Critical", "Critical", "Critical",
+            "High", "High", "High", "High",
+            "Medium", "Medium", "Medium", "Medium",
+            "Low", "Low", "Low", "Low"
+        ],
+        "Severity": [
+            "Critical", "High", "Medium", "Low",
+            "Critical", "High", "Medium", "Low",
+            "Critical", "High", "Medium", "Low",
+            "Critical", "High", "Medium", "Low"
+        ],
+        "Suggested Color": [
+            "Dark Red", "Red", "Orange-Red", "Orange",
+            "Red", "Orange-Red", "Orange", "Yellow-Orange",
+            "Orange", "Yellow-Orange", "Yellow", "Light Yellow",
+            "Yellow", "Light Yellow", "Green-Yellow", "Green"
         ]
-        self.categories = self.KPI_list + self.KRI_list
-        self.severities = ["Low", "Medium", "High", "Critical"]
-        self.statuses = ["Open", "In Progress", "Resolved","Closed"]
-        self.reporters = [f"Reporter {i}" for i in range(1, self.num_reporters + 1)]
-        self.assignees = [f"Assignee {i}" for i in range(1, self.num_assignees + 1)]
-        self.users = [f"User_{i}" for i in range(1, self.num_users + 1)]
-        self.departments = ["IT", "Finance", "Operations", "HR", "Legal",
-                            "Sales", "C-Suite Executives", "External Contractors"]
-        self.locations = ["CANADA", "USA", "Unknown", "EU", "DE", "FR", "JP", "CN", "AU", "IN", "UK"]
-
-        self.columns = [
-            "Issue ID", "Issue Key", "Issue Name", "Issue Volume", "Category",
-            "Severity", "Status", "Reporters", "Assignees", "Date Reported",
-            "Date Resolved", "Issue Response Time Days", "Impact Score", "Risk Level",
-            "Department Affected", "Remediation Steps", "Cost", "KPI/KRI", "User ID",
-            "Timestamps", "Activity Type","User Location", "IP Location",
-            "Session Duration in Second", "Num Files Accessed", "Login Attempts",
-            "Data Transfer MB", "CPU Usage %", "Memory Usage MB", "Threat Score",
-            "Threat Level", "Defense Action"
+    }
+
+    #---------------------------------------------Define columns---------------------------------------------------
+    numerical_columns = [
+        "Timestamps", "Issue Response Time Days", "Impact Score", "Cost",
+        "Session Duration in Second", "Num Files Accessed", "Login Attempts",
+        "Data Transfer MB", "CPU Usage %", "Memory Usage MB", "Threat Score"
         ]
 
-        # ------------------ Extra DataFrames ------------------
-        self.ktis_data = {
-            "KIT": [
-                "Severity", "Impact Score", "Risk Level", "Response Time", "Category",
-                "Activity Type", "Login Attempts", "Num Files Accessed", "Data Transfer MB",
-                "CPU Usage %", "Memory Usage MB"
-            ],
-            "Condition": [
-                "Critical = 10, High = 8, Medium = 5, Low = 2",
-                "1 to 10 (already a score)",
-                "High = 8, Medium = 5, Low = 2",
-                ">7 days = 5, 3-7 days = 3, <3 days = 1",
-                "Unauthorized Access = 8, Phishing = 6, etc.",
-                "High-risk types (e.g., login, data_transfer)",
-                ">5 = 5, 3-5 = 3, <3 = 1",
-                ">10 = 5, 5-10 = 3, <5 = 1",
-                ">100 MB = 5, 50-100 MB = 3, <50 MB = 1",
-                ">80% = 5, 60-80% = 3, <60% = 1",
-                ">8000 MB = 5, 4000-8000 MB = 3, <4000 MB = 1"
-            ],
-            "Score": [
-                "2 - 10", "1 - 10", "2 - 8", "1 - 5", "1 - 8", "1 - 5", "1 - 5", "1 - 5", "1 - 5", "1 - 5", "1 - 5"
-            ]
-        }
-        self.ktis_key_threat_indicators_df = pd.DataFrame(self.ktis_data)
-
-        self.scenario_data = {
-            "Scenario": list(range(1, 17)),
-            "Threat Level": [
-                "Critical", "Critical", "Critical", "Critical",
-                "High", "High", "High", "High",
-                "Medium", "Medium", "Medium", "Medium",
-                "Low", "Low", "Low", "Low"
-            ],
-            "Severity": [
-                "Critical", "High", "Medium", "Low",
-                "Critical", "High", "Medium", "Low",
-                "Critical", "High", "Medium", "Low",
-                "Critical", "High", "Medium", "Low"
-            ],
-            "Suggested Color": [
-                "Dark Red", "Red", "Orange-Red", "Orange",
-                "Red", "Orange-Red", "Orange", "Yellow-Orange",
-                "Orange", "Yellow-Orange", "Yellow", "Light Yellow",
-                "Yellow", "Light Yellow", "Green-Yellow", "Green"
-            ]
-        }
-        self.scenarios_with_colors_df = pd.DataFrame(self.scenario_data)
-
-        #---------------------------------------------Define columns---------------------------------------------------
-        self.numerical_columns = [
-            "Timestamps", "Issue Response Time Days", "Impact Score", "Cost",
-            "Session Duration in Second", "Num Files Accessed", "Login Attempts",
-            "Data Transfer MB", "CPU Usage %", "Memory Usage MB", "Threat Score"
-            ]
-
-
-        self.explanatory_data_analysis_columns = [
-            "Date Reported", "Issue Response Time Days", "Impact Score", "Cost",
-            "Session Duration in Second", "Num Files Accessed", "Login Attempts",
-            "Data Transfer MB", "CPU Usage %", "Memory Usage MB", "Threat Score"
-            ]
-
-        self.user_activity_features = [
-            "Risk Level", "Issue Response Time Days", "Impact Score", "Cost",
-            "Session Duration in Second", "Num Files Accessed", "Login Attempts",
-            "Data Transfer MB", "CPU Usage %", "Memory Usage MB", "Threat Score"
-            ]
-
-
-        self.initial_dates_columns = ["Date Reported", "Date Resolved", "Timestamps"]
-
-        self.categorical_columns = ["Issue ID", "Issue Key", "Issue Name", "Category", "Severity", "Status", "Reporters",
-                               "Assignees", "Risk Level", "Department Affected", "Remediation Steps", "KPI/KRI",
-                               "User ID", "Activity Type", "User Location", "IP Location", "Threat Level",      "Defense Action", "Color"
-                               ]
-        self.features_engineering_columns = [
-            "Issue Response Time Days", "Impact Score", "Cost",
-            "Session Duration in Second", "Num Files Accessed", "Login Attempts",
-            "Data Transfer MB", "CPU Usage %", "Memory Usage MB", "Threat Score", "Threat Level"
-            ]
-        self.numerical_behavioral_features = [
-            "Login Attempts", "Data Transfer MB", "CPU Usage %", "Memory Usage MB",
-            "Session Duration in Second", "Num Files Accessed", "Threat Score"
-            ]
-
-        #IP addresses, port numbers, packet sizes, and time intervals
-        # ---------------------Generate user activity metadata------------------------
-        self.activity_types = ["login", "file_access", "data_modification"]
+
+    explanatory_data_analysis_columns = [
+        "Date Reported", "Issue Response Time Days", "Impact Score", "Cost",
+        "Session Duration in Second", "Num Files Accessed", "Login Attempts",
+        "Data Transfer MB", "CPU Usage %", "Memory Usage MB", "Threat Score"
+        ]
+
+    user_activity_features = [
+        "Risk Level", "Issue Response Time Days", "Impact Score", "Cost",
+        "Session Duration in Second", "Num Files Accessed", "Login Attempts",
+        "Data Transfer MB", "CPU Usage %", "Memory Usage MB", "Threat Score"
+        ]
+
+
+    initial_dates_columns = ["Date Reported", "Date Resolved", "Timestamps"]
+
+    categorical_columns = ["Issue ID", "Issue Key", "Issue Name", "Category", "Severity", "Status", "Reporters",
+                           "Assignees", "Risk Level", "Department Affected", "Remediation Steps", "KPI/KRI",
+                           "User ID", "Activity Type", "User Location", "IP Location", "Threat Level",      "Defense Action", "Color"
+                           ]
+    features_engineering_columns = [
+        "Issue Response Time Days", "Impact Score", "Cost",
+        "Session Duration in Second", "Num Files Accessed", "Login Attempts",
+        "Data Transfer MB", "CPU Usage %", "Memory Usage MB", "Threat Score", "Threat Level"
+        ]
+    numerical_behavioral_features = [
+        "Login Attempts", "Data Transfer MB", "CPU Usage %", "Memory Usage MB",
+        "Session Duration in Second", "Num Files Accessed", "Threat Score"
+        ]
+
+    #IP addresses, port numbers, packet sizes, and time intervals
+    # ---------------------Generate user activity metadata------------------------
+    activity_types = ["login", "file_access", "data_modification"]
 
     def get_column_dic(self):
         """
@@ -204,15 +462,123 @@ class DataConfig:
 # Data Generator (keep your original generation logic here)
 # =====================================================================
 class DataGenerator:
-    def __init__(self, config):
+    def __init__(self, config, user_profiles=None, department_profiles=None, seed_sequence=None, increment=0,
+                 issue_rates=None):
         self.config = config
-        self.user_profiles = {user: {'baseline_activity': random.uniform(0.5, 1.5),
-                                     'risk_tolerance': random.uniform(0.8, 1.2)} for user in self.config.users}
-        self.department_profiles = {dept: {'baseline_risk': random.uniform(0.5, 1.5),
-                                         'activity_multiplier': random.uniform(0.8, 1.2)} for dept in self.config.departments}
-        self.anomalous_issue_ids = [f"ISSUE-{i:04d}" for i in range(self.config.num_normal_issues +1, self.config.total_issues + 1)]
-        self.anomalous_issue_keys = [f"KEY-{i:04d}" for i in range(self.config.num_normal_issues +1, self.config.total_issues + 1)]
-    
+        # A single Generator, seeded from config.seed, drives all sampling of this generator;
+        # parallel shards get generators spawned from the same SeedSequence
+        self.seed_sequence = seed_sequence if seed_sequence is not None else np.random.SeedSequence(self.config.seed)
+        self.rng = np.random.default_rng(self.seed_sequence)
+        # Number of incremental runs (see from_state) that preceded this one
+        self.increment = increment
+        # Daily issue rates and the fractional issues not yet generated; an increment inherits them
+        # from the saved state, a base run derives them from its counts and date range
+        if issue_rates is None:
+            days = max(1, (self.config.end_date - self.config.start_date).days)
+            issue_rates = {
+                "normal_issues_per_day": self.config.num_normal_issues / days,
+                "anomalous_issues_per_day": self.config.num_anomalous_issues / days,
+                "normal_issues_carry": 0.0,
+                "anomalous_issues_carry": 0.0,
+            }
+        self.issue_rates = issue_rates
+        # Profile tables can be passed in so that every shard of a parallel run shares them
+        self.user_profiles = user_profiles if user_profiles is not None else self._draw_profiles(
+            self.config.users, {'baseline_activity': (0.5, 1.5), 'risk_tolerance': (0.8, 1.2)})
+        self.department_profiles = department_profiles if department_profiles is not None else self._draw_profiles(
+            self.config.departments, {'baseline_risk': (0.5, 1.5), 'activity_multiplier': (0.8, 1.2)})
+
+
+    #------------------------- Incremental generation -------------------------
+    def state(self):
+        """
+        State needed to extend this generator's dataset later (see from_state): the profile
+        tables, the next issue number and ID width, the date watermark (config.end_date),
+        the daily issue rates with their fractional carry, and the seed.
+        """
+        return {
+            "user_profiles": self.user_profiles,
+            "department_profiles": self.department_profiles,
+            "next_issue_number": self.config.last_issue_number + 1,
+            "issue_id_width": self.config.effective_issue_id_width,
+            "watermark": self.config.end_date.isoformat(),
+            **self.issue_rates,
+            "seed_entropy": self.seed_sequence.entropy,
+            "increment": self.increment,
+        }
+
+    def save_state(self, path):
+        """Writes state() as JSON to path (atomically, so an interrupted run keeps the previous state)."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(f"{path}.part", "w", encoding="utf-8") as f:
+            json.dump(self.state(), f, indent=2)
+        os.replace(f"{path}.part", path)
+
+    @classmethod
+    def from_state(cls, path, days, config=None):
+        """
+        Creates a generator that continues the dataset described by a saved state.
+
+        The new generator reuses the user and department profiles, numbers its issues
+        after the last saved one with the same ID width, covers the `days` days following
+        the watermark with the saved daily issue rates, and draws from a fresh stream of
+        the saved seed, so consecutive top-ups are reproducible and never repeat rows:
+        increment k uses the (1, k) child of the seed's SeedSequence, apart from the
+        (0, shard) children of the shards (see DataGenerator._shard_seed_sequence).
+
+        Args:
+            path (str): State file written by save_state.
+            days (int): Number of days to add.
+            config (DataConfig, optional): Settings of the new run (output options etc.);
+                the fields derived from the state replace its own.
+
+        Returns:
+            DataGenerator: The generator of the increment; its config holds the new date range.
+        """
+        with open(path, encoding="utf-8") as f:
+            state = json.load(f)
+        watermark = datetime.fromisoformat(state["watermark"])
+        increment = state["increment"] + 1
+        # The rates pass through unchanged; the fraction of an issue a short increment cannot
+        # generate is carried to the next one, so low rates still add up over many top-ups
+        issue_rates, counts = {}, {}
+        for kind in ("normal", "anomalous"):
+            rate = state[f"{kind}_issues_per_day"]
+            expected = rate * days + state.get(f"{kind}_issues_carry", 0.0)
+            counts[kind] = int(expected + 1e-9)
+            issue_rates[f"{kind}_issues_per_day"] = rate
+            issue_rates[f"{kind}_issues_carry"] = max(0.0, expected - counts[kind])
+        config = (config if config is not None else DataConfig.load()).replace(
+            start_date=watermark, end_date=watermark + timedelta(days=days),
+            num_normal_issues=counts["normal"], num_anomalous_issues=counts["anomalous"],
+            num_users=len(state["user_profiles"]), num_departments=len(state["department_profiles"]),
+            first_issue_number=state["next_issue_number"], issue_id_width=state["issue_id_width"],
+            seed=state["seed_entropy"])
+        seed_sequence = np.random.SeedSequence(state["seed_entropy"], spawn_key=(1, increment))
+        return cls(config, user_profiles=state["user_profiles"], department_profiles=state["department_profiles"],
+                   seed_sequence=seed_sequence, increment=increment, issue_rates=issue_rates)
+
+    def _issue_ids(self, start, stop, anomalous=False):
+        """
+        IDs and keys of the normal (or anomalous) issues start..stop-1; anomalous issues
+        are numbered after all normal issues.
+        """
+        offset = self.config.first_issue_number + (self.config.num_normal_issues if anomalous else 0)
+        return self.config.format_issue_ids(np.arange(start + offset, stop + offset))
+
+    def _draw_profiles(self, names, ranges):
+        """
+        Draws a profile table with one uniform value per (name, attribute).
+
+        Args:
+            names (list): Users or departments.
+            ranges (dict): Attribute name to (low, high) bounds.
+
+        Returns:
+            dict: name -> {attribute: value}.
+        """
+        values = {attribute: self.rng.uniform(low, high, len(names)) for attribute, (low, high) in ranges.items()}
+        return {name: {attribute: float(values[attribute][i]) for attribute in ranges} for i, name in enumerate(names)}
 
     #                   -----------------------------------------------------------------------
     #                      Generate normal issue names for each KPI and KRI by Mapping
@@ -295,6 +661,19 @@ class DataGenerator:
         return anomalous_issue_mapping.get(category, "Unknown Issue")
 
 
+    def _issue_name_categories(self):
+        """
+        Categories shared by the Issue Name column of normal and anomalous issues, so
+        that concatenating both keeps the category dtype.
+
+        Returns:
+            tuple: (pd.Index of names, normal name code per category, anomalous name code per category).
+        """
+        normal_names = [self.generate_normal_issues_name(c) for c in self.config.categories]
+        anomalous_names = [self.generate_anomalous_issue_name(c) for c in self.config.categories]
+        names = pd.Index(pd.unique(np.array(normal_names + anomalous_names, dtype=object)))
+        return names, names.get_indexer(normal_names), names.get_indexer(anomalous_names)
+
     #-------------------------Implementation-----------------------------------
     # filter KPI Vs KRI
     def filter_kpi_and_kri(self, category):
@@ -325,7 +704,7 @@ class DataGenerator:
             datetime: A random datetime object within the specified range.
         """
         # Calculate the difference in days and add a random number of days to the start date
-        return start + timedelta(days=np.random.randint(0, (end - start).days))
+        return start + timedelta(days=int(self.rng.integers(0, (end - start).days)))
 
     # ----------------------------------Define threat level calculation-----------------------------------------------------
     def calculate_threat_level(self, severity, impact_score, risk_level, response_time_days,
@@ -384,8 +763,115 @@ class DataGenerator:
         else:
             return "Low", threat_score
     
+    # ----------------------------------Vectorized threat score kernel-----------------------------------------------------
+    # Weights of the threat score; override per call (or on a subclass) to re-score existing data.
+    threat_score_weights = {
+        "severity": 0.25, "impact": 0.2, "risk": 0.15, "response_time": 0.1,
+        "login_attempts": 0.05, "files_accessed": 0.05, "data_transfer": 0.05,
+        "cpu_usage": 0.075, "memory_usage": 0.075
+    }
+
+    def calculate_threat_levels(self, severity, impact_score, risk_level, response_time_days,
+                                login_attempts, num_files_accessed, data_transfer_MB,
+                                cpu_usage_percent, memory_usage_MB, weights=None):
+        """
+        Array version of calculate_threat_level: scores whole columns in one call.
+
+        Severity and risk level are ordinal-coded against config.severities and the
+        numeric thresholds are bucketed with np.digitize, using the same cut points
+        as the scalar version.
+
+        Args:
+            severity (array-like): Severities ('Low', 'Medium', 'High', 'Critical').
+            impact_score (array-like): Impact scores (1-10).
+            risk_level (array-like): Risk levels ('Low', 'Medium', 'High', 'Critical').
+            response_time_days (array-like): Response times in days.
+            login_attempts (array-like): Login attempts.
+            num_files_accessed (array-like): Number of files accessed.
+            data_transfer_MB (array-like): Data transferred in MB.
+            cpu_usage_percent (array-like): CPU usage percentages.
+            memory_usage_MB (array-like): Memory usage in MB.
+            weights (dict, optional): Overrides for threat_score_weights.
+
+        Returns:
+            tuple: (threat levels as pd.Categorical, threat scores as np.ndarray).
+        """
+        w = {**self.threat_score_weights, **(weights or {})}
+        # Ordinal scores for Low, Medium, High, Critical; unknown labels (code -1) score 1
+        ordinal_scores = np.array([2, 5, 8, 10, 1])
+        severity_score = ordinal_scores[pd.Categorical(severity, categories=self.config.severities).codes]
+        risk_score = ordinal_scores[pd.Categorical(risk_level, categories=self.config.severities).codes]
+
+        def bucket(values, low, high):
+            # 1 if value <= low, 3 if low < value <= high, 5 if value > high
+            return np.array([1, 3, 5])[np.digitize(np.asarray(values, dtype=float), [low, high], right=True)]
+
+        threat_score = (
+            w["severity"] * severity_score +
+            w["impact"] * np.asarray(impact_score, dtype=float) +
+            w["risk"] * risk_score +
+            w["response_time"] * bucket(response_time_days, 3, 7) +
+            w["login_attempts"] * bucket(login_attempts, 3, 5) +
+            w["files_accessed"] * bucket(num_files_accessed, 5, 10) +
+            w["data_transfer"] * bucket(data_transfer_MB, 50, 100) +
+            w["cpu_usage"] * bucket(cpu_usage_percent, 60, 85) +
+            w["memory_usage"] * bucket(memory_usage_MB, 6000, 10000)
+        )
+
+        # Low < 4 <= Medium < 7 <= High < 9 <= Critical
+        threat_level = pd.Categorical.from_codes(np.digitize(threat_score, [4, 7, 9]),
+                                                 categories=self.config.severities, ordered=True)
+        return threat_level, threat_score
+
+    def rescore_threats(self, df, weights=None):
+        """
+        Recomputes Threat Score and Threat Level of an existing issues DataFrame in place,
+        e.g. after tuning threat_score_weights, without regenerating the data.
+
+        Args:
+            df (pd.DataFrame): Issues with the columns produced by the generators.
+            weights (dict, optional): Overrides for threat_score_weights.
+
+        Returns:
+            pd.DataFrame: The same DataFrame with updated threat columns.
+        """
+        df["Threat Level"], df["Threat Score"] = self.calculate_threat_levels(
+            df["Severity"], df["Impact Score"], df["Risk Level"], df["Issue Response Time Days"],
+            df["Login Attempts"], df["Num Files Accessed"], df["Data Transfer MB"],
+            df["CPU Usage %"], df["Memory Usage MB"], weights=weights
+        )
+        return df
+
         #--------------------- Adaptive defense mechanism based on threat level and conditions----------------------------------
 
+    # Map the threat level and severity to actions based on scenarios
+    threat_severity_actions = {
+        ("Critical", "Critical"): "Immediate System-wide Shutdown & Investigation",
+        ("Critical", "High"): "Escalate to Security Operations Center (SOC) & Block User",
+        ("Critical", "Medium"): "Isolate Affected System & Restrict User Access",
+        ("Critical", "Low"): "Increase Monitoring & Schedule Review",
+        ("High", "Critical"): "Escalate to SOC & Restrict Critical System Access",
+        ("High", "High"): "Restrict User Activity & Monitor Logs",
+        ("High", "Medium"): "Alert Security Team & Review Logs",
+        ("High", "Low"): "Flag for Review",
+        ("Medium", "Critical"): "Increase Monitoring & Investigate",
+        ("Medium", "High"): "Schedule Investigation",
+        ("Medium", "Medium"): "Routine Monitoring",
+        ("Medium", "Low"): "Log Activity for Reference",
+        ("Low", "Critical"): "Log and Notify",
+        ("Low", "High"): "Routine Monitoring",
+        ("Low", "Medium"): "Log for Reference",
+        ("Low", "Low"): "No Action Needed"
+    }
+    # Additional responses, appended in this order when their condition holds
+    defense_action_suffixes = [
+        " | Lock Account & Alert",
+        " | Restrict File Access",
+        " | Require Multi-Factor Authentication (MFA)",
+        " | Limit Data Transfer"
+    ]
+    _defense_action_tables = {}
+
     def adaptive_defense_mechanism(self, row):
         """
         Determines the adaptive response based on threat level, severity, and activity context.
@@ -398,329 +884,616 @@ class DataGenerator:
         """
         action = "Monitor"
 
-        # Map the threat level and severity to actions based on scenarios
-        threat_severity_actions = {
-            ("Critical", "Critical"): "Immediate System-wide Shutdown & Investigation",
-            ("Critical", "High"): "Escalate to Security Operations Center (SOC) & Block User",
-            ("Critical", "Medium"): "Isolate Affected System & Restrict User Access",
-            ("Critical", "Low"): "Increase Monitoring & Schedule Review",
-            ("High", "Critical"): "Escalate to SOC & Restrict Critical System Access",
-            ("High", "High"): "Restrict User Activity & Monitor Logs",
-            ("High", "Medium"): "Alert Security Team & Review Logs",
-            ("High", "Low"): "Flag for Review",
-            ("Medium", "Critical"): "Increase Monitoring & Investigate",
-            ("Medium", "High"): "Schedule Investigation",
-            ("Medium", "Medium"): "Routine Monitoring",
-            ("Medium", "Low"): "Log Activity for Reference",
-            ("Low", "Critical"): "Log and Notify",
-            ("Low", "High"): "Routine Monitoring",
-            ("Low", "Medium"): "Log for Reference",
-            ("Low", "Low"): "No Action Needed"
-        }
-
         # Assign action based on scenario
-        action = threat_severity_actions.get((row["Threat Level"], row["Severity"]), action)
+        action = self.threat_severity_actions.get((row["Threat Level"], row["Severity"]), action)
 
         # Additional responses based on user behavior and thresholds
         if row["Threat Level"] in ["Critical", "High"] and row["Login Attempts"] > 5:
-            action += " | Lock Account & Alert"
+            action += self.defense_action_suffixes[0]
         if row["Activity Type"] == "File Access" and row["Num Files Accessed"] > 15:
-            action += " | Restrict File Access"
+            action += self.defense_action_suffixes[1]
         if row["Activity Type"] == "Login" and row["Login Attempts"] > 10:
-            action += " | Require Multi-Factor Authentication (MFA)"
+            action += self.defense_action_suffixes[2]
         if row["Data Transfer MB"] > 100:
-            action += " | Limit Data Transfer"
+            action += self.defense_action_suffixes[3]
 
         return action
 
+    def _defense_action_table(self):
+        """
+        Precomputes every possible defense action string once per level list.
 
-    def generate_normal_issues_df(self, p_issue_ids, p_issue_keys):
-        """Generates a DataFrame of synthetic normal cybersecurity issue data with enhanced logic."""
-        normal_issues_data = []
-        time_difference_days = (self.config.end_date - self.config.start_date).days
-        # Handle the case where the time difference is zero or negative
-        days_increment = max(1, time_difference_days)
-
-        # Ensure the divisor for date calculation is at least 1
-        date_divisor = max(1, self.config.num_normal_issues // days_increment)
-
-
-        for i, (issue_id, issue_key) in enumerate(zip(p_issue_ids, p_issue_keys)):
-            issue_volume = 1
-            category = random.choice(self.config.categories)
-            issue_name = self.generate_normal_issues_name(category)
-            severity = random.choice(self.config.severities)
-            status = random.choice(self.config.statuses)
-            reporter = random.choice(self.config.reporters)
-            assignee = random.choice(self.config.assignees)
-
-            # Temporal Pattern: Daily/Weekly spikes and overall trend
-            # Adjusted calculation to avoid division by zero
-            date_reported = self.config.start_date + timedelta(days=i // date_divisor,
-                                                   hours=random.randint(0, 23), minutes=random.randint(0, 59))
-            # Add weekly peak
-            if date_reported.weekday() in [4, 5]: # Friday, Saturday
-                 date_reported += timedelta(hours=random.randint(2, 6))
-            # Add daily peak (e.g., morning)
-            if date_reported.hour in [9, 10, 11]:
-                 date_reported += timedelta(minutes=random.randint(15, 45))
-
-
-            # Remediation Effectiveness: Depends on severity, status, and a simulated assignee workload
-            assignee_workload = random.uniform(0.5, 1.5) # Simulate workload
-            severity_factor = {"Low": 0.8, "Medium": 1.0, "High": 1.5, "Critical": 2.0}.get(severity, 1.0)
-            status_factor = 1.0 if status in ["Resolved", "Closed"] else 2.0 # Open/In Progress might take longer
-            avg_resolution_days = 7 * severity_factor * assignee_workload * status_factor # Base resolution time
-            issue_response_time_days = max(1, int(np.random.normal(loc=avg_resolution_days, scale=avg_resolution_days/3)))
-            date_resolved = date_reported + timedelta(days=issue_response_time_days) if status in ["Resolved", "Closed"] else self.config.current_date + timedelta(days=random.randint(30,180)) # Simulate future resolution for open issues
-
-            # Feature Dependencies and Realistic Distributions
-            user_id = random.choice(self.config.users)
-            department_affected = random.choice(self.config.departments)
-            user_profile = self.user_profiles[user_id]
-            department_profile = self.department_profiles[department_affected]
-
-            timestamp = date_reported + timedelta(hours=np.random.randint(0, 24), minutes=np.random.randint(0, 60))
-
-            activity_type = random.choice(self.config.activity_types)
-            user_location = random.choice(self.config.locations) # User location should be generated per issue
-            ip_location = user_location if np.random.rand() > 0.8 else random.choice([loc for loc in self.config.locations if loc != user_location])
-
-            # Session Duration: Exponential distribution, adjusted by activity type and profiles
-            base_session_duration = 600 # seconds
-            activity_multiplier = {"login": 0.5, "file_access": 1.5, "data_modification": 2.0}.get(activity_type, 1.0)
-            session_duration = max(10, int(np.random.exponential(scale=base_session_duration * activity_multiplier * user_profile['baseline_activity'])))
-
-            # Num Files Accessed: Poisson or Negative Binomial, adjusted by activity type and profiles
-            base_files_accessed = 5
-            activity_multiplier_files = {"login": 0.1, "file_access": 2.0, "data_modification": 1.5}.get(activity_type, 1.0)
-            num_files_accessed = int(max(1, np.random.poisson(lam=base_files_accessed * activity_multiplier_files * user_profile['baseline_activity'] * department_profile['activity_multiplier'])))
-
-
-            # Login Attempts: Negative Binomial (for bursty attempts), adjusted by profiles
-            base_login_attempts = 3
-            login_attempts = max(1, np.random.negative_binomial(n=3, p=0.5) + base_login_attempts * user_profile['baseline_activity'] * department_profile['baseline_risk'])
-
-
-            # Data Transfer MB: Pareto distribution (few large, many small), adjusted by activity type and profiles
-            base_data_transfer = 10 # MB
-            activity_multiplier_transfer = {"login": 0.1, "file_access": 1.5, "data_modification": 2.5}.get(activity_type, 1.0)
-            data_transfer_MB = max(0.1, np.random.pareto(a=2.0) * base_data_transfer * activity_multiplier_transfer * user_profile['baseline_activity'] * department_profile['activity_multiplier'])
-
-            # CPU/Memory Usage: Dependent on activity type and session duration
-            base_cpu = 30
-            base_mem = 4000
-            cpu_usage_percent = max(1, min(100, np.random.normal(loc=base_cpu + session_duration/300, scale=10)))
-            memory_usage_MB = max(512, np.random.normal(loc=base_mem + session_duration*5, scale=1000))
-
-
-            # Impact Score and Cost: Dependent on Severity and Category
-            base_impact = 5
-            base_cost = 5000
-            severity_impact_multiplier = {"Low": 1.0, "Medium": 1.5, "High": 2.5, "Critical": 4.0}.get(severity, 1.0)
-            category_impact_multiplier = {"Data Breach": 3.0, "Malware": 2.0, "Unauthorized Access": 2.5}.get(category, 1.0) # Example category impact
-            impact_score = max(1, min(10, int(np.random.normal(loc=base_impact * severity_impact_multiplier * category_impact_multiplier * user_profile['risk_tolerance'], scale=3))))
-            cost = max(100, np.random.normal(loc=base_cost * severity_impact_multiplier * category_impact_multiplier * department_profile['baseline_risk'], scale=2000))
-
-            # Risk Level Calculation (was missing)
-            risk_level = 'Critical' if impact_score > 8 else 'High' if impact_score > 5 else 'Medium' if impact_score > 3 else 'Low'
-
-            # KPI/KRI Calculation (was missing)
-            kpi_kri = self.filter_kpi_and_kri(category)
-
-            remediation_steps = f"Steps to resolve {issue_name}" # Remediation Steps (was missing)
-
-
-            threat_level, threat_score = self.calculate_threat_level(
-                severity, impact_score, risk_level, issue_response_time_days,
-                login_attempts, num_files_accessed, data_transfer_MB,
-                cpu_usage_percent, memory_usage_MB
-            )
-
-            row_data = {
-                "Severity": severity, "Impact Score": impact_score, "Risk Level": risk_level,
-                "Issue Response Time Days": issue_response_time_days, "Login Attempts": login_attempts,
-                "Num Files Accessed": num_files_accessed, "Data Transfer MB": data_transfer_MB,
-                "CPU Usage %": cpu_usage_percent, "Memory Usage MB": memory_usage_MB,
-                "Threat Level": threat_level, "Activity Type": activity_type
-            }
-            defense_action = self.adaptive_defense_mechanism(row_data)
+        Codes are laid out as ((threat * (L + 1)) + severity) * 16 + suffix_bits, where
+        L = len(config.severities) and index L stands for an unknown label ("Monitor").
 
+        Returns:
+            tuple: (np.ndarray mapping each code to a category index, pd.Index of unique actions).
+        """
+        levels = tuple(self.config.severities)
+        if levels not in self._defense_action_tables:
+            n_suffixes = len(self.defense_action_suffixes)
+            actions = []
+            for threat in levels + (None,):
+                for severity in levels + (None,):
+                    base = self.threat_severity_actions.get((threat, severity), "Monitor")
+                    for bits in range(2 ** n_suffixes):
+                        actions.append(base + "".join(
+                            suffix for k, suffix in enumerate(self.defense_action_suffixes) if bits >> k & 1))
+            # Different scenarios share actions (e.g. "Routine Monitoring"), so deduplicate for the categories
+            self._defense_action_tables[levels] = pd.factorize(np.array(actions, dtype=object))
+        return self._defense_action_tables[levels]
+
+    def adaptive_defense_mechanisms(self, threat_level, severity, activity_type, login_attempts,
+                                    num_files_accessed, data_transfer_MB):
+        """
+        Array version of adaptive_defense_mechanism: selects the action of every row from
+        the precomputed action table using integer codes built from boolean masks.
 
-            normal_issues_data.append([
-                issue_id, issue_key, issue_name, issue_volume, category, severity, status, reporter, assignee,
-                date_reported, date_resolved, issue_response_time_days, impact_score, risk_level, department_affected,
-                remediation_steps, cost, kpi_kri, user_id, timestamp, activity_type, user_location, ip_location,
-                session_duration, num_files_accessed, login_attempts, data_transfer_MB,
-                cpu_usage_percent, memory_usage_MB, threat_score, threat_level, defense_action
-            ])
+        Args:
+            threat_level (array-like): Threat levels.
+            severity (array-like): Severities.
+            activity_type (array-like): Activity types.
+            login_attempts (array-like): Login attempts.
+            num_files_accessed (array-like): Number of files accessed.
+            data_transfer_MB (array-like): Data transferred in MB.
 
-        df = pd.DataFrame(normal_issues_data, columns=self.config.columns)
-        return df
+        Returns:
+            pd.Categorical: The suggested defense action(s) for every row.
+        """
+        table_codes, actions = self._defense_action_table()
+        n_levels = len(self.config.severities) + 1
+        # Unknown labels get code -1, which wraps onto the trailing "unknown" slot
+        threat = pd.Categorical(threat_level, categories=self.config.severities).codes % n_levels
+        severity = pd.Categorical(severity, categories=self.config.severities).codes % n_levels
+        activity_type = np.asarray(activity_type, dtype=object)
+        login_attempts = np.asarray(login_attempts)
+
+        bits = (
+            (np.isin(threat, [self.config.severities.index("Critical"), self.config.severities.index("High")])
+             & (login_attempts > 5)).astype(np.int64)
+            | ((activity_type == "File Access") & (np.asarray(num_files_accessed) > 15)) << 1
+            | ((activity_type == "Login") & (login_attempts > 10)) << 2
+            | (np.asarray(data_transfer_MB) > 100) << 3
+        )
+        codes = (threat.astype(np.int64) * n_levels + severity) * 2 ** len(self.defense_action_suffixes) + bits
+        return pd.Categorical.from_codes(table_codes[codes], categories=actions)
 
 
-    def generate_anomalous_issues_df(self, p_anomalous_issue_ids, p_anomalous_issue_keys):
-        """Generates a DataFrame of synthetic anomalous cybersecurity issue data with enhanced logic."""
-        anomalous_issues_data = []
+    #------------------------- Batch (columnar) generation helpers -------------------------
+    def _lookup(self, mapping, keys, default):
+        """
+        Builds a lookup array aligned with a list of keys, so per-row dict lookups
+        become a single fancy-indexing operation on category codes.
+
+        Args:
+            mapping (dict): Key to value mapping.
+            keys (list): Ordered keys (e.g. config.severities); position i holds mapping[keys[i]].
+            default (float): Value used for keys missing from the mapping.
+
+        Returns:
+            np.ndarray: Float array of len(keys) values.
+        """
+        return np.array([mapping.get(key, default) for key in keys], dtype=float)
+
+    def _profile_arrays(self, user_idx, department_idx):
+        """
+        Expands the user and department profile tables to one value per row.
+
+        Args:
+            user_idx (np.ndarray): Index into config.users for every row.
+            department_idx (np.ndarray): Index into config.departments for every row.
+
+        Returns:
+            tuple: (baseline_activity, risk_tolerance, baseline_risk, activity_multiplier) arrays.
+        """
+        users = [self.user_profiles[user] for user in self.config.users]
+        departments = [self.department_profiles[dept] for dept in self.config.departments]
+        baseline_activity = np.array([p['baseline_activity'] for p in users])[user_idx]
+        risk_tolerance = np.array([p['risk_tolerance'] for p in users])[user_idx]
+        baseline_risk = np.array([p['baseline_risk'] for p in departments])[department_idx]
+        activity_multiplier = np.array([p['activity_multiplier'] for p in departments])[department_idx]
+        return baseline_activity, risk_tolerance, baseline_risk, activity_multiplier
+
+    def _other_location_idx(self, user_location_idx):
+        """
+        Draws, for every row, a location different from the user location.
 
-        for i, (issue_id, issue_key) in enumerate(zip(p_anomalous_issue_ids, p_anomalous_issue_keys)):
-            issue_volume = 1
-            category = random.choice(self.config.categories)
-            issue_name = self.generate_anomalous_issue_name(category)
-            severity = np.random.choice(self.config.severities, p=[0.05, 0.15, 0.4, 0.4]) # Higher probability for High/Critical
-            status = random.choice(self.config.statuses)
-            reporter = random.choice(self.config.reporters)
-            assignee = random.choice(self.config.assignees)
+        A uniform draw over the remaining len(locations) - 1 slots is shifted past the
+        user's own index, which is equivalent to random.choice over the filtered list
+        without building that list per row.
+        """
+        shifted = self.rng.integers(0, len(self.config.locations) - 1, len(user_location_idx))
+        return shifted + (shifted >= user_location_idx)
+
+    # Label columns generated as codes, with the config attribute listing their categories
+    categorical_column_levels = {
+        "Category": "categories", "Severity": "severities", "Status": "statuses",
+        "Reporters": "reporters", "Assignees": "assignees", "Department Affected": "departments",
+        "User ID": "users", "Activity Type": "activity_types",
+        "User Location": "locations", "IP Location": "locations"
+    }
+    # Storage dtypes of the numeric columns when config.compact_dtypes is set
+    compact_column_dtypes = {
+        "Issue Volume": np.int8, "Issue Response Time Days": np.int32, "Impact Score": np.int8,
+        "Cost": np.float32, "Session Duration in Second": np.int32, "Num Files Accessed": np.int32,
+        "Login Attempts": np.int16, "Data Transfer MB": np.float32, "CPU Usage %": np.float32,
+        "Memory Usage MB": np.float32, "Threat Score": np.float32, "Is Anomaly": np.int8
+    }
+
+    def _labels(self, codes, categories):
+        """Category codes as a pd.Categorical, or as object strings without config.compact_dtypes."""
+        if self.config.compact_dtypes:
+            return pd.Categorical.from_codes(codes, categories=categories)
+        return np.asarray(categories, dtype=object)[codes]
+
+    def _is_anomaly_column(self, n, value):
+        return np.full(n, value, dtype=np.int8 if self.config.compact_dtypes else np.int64)
+
+    def _report_day_cdf(self):
+        """
+        Cumulative distribution of normal report dates over the days of the date range.
 
-            # Temporal Pattern: Deviations from normal patterns
-            date_reported = self.random_date(self.config.start_date, self.config.end_date) + timedelta(hours=random.randint(0, 23), minutes=random.randint(0, 59))
-            # Introduce activity outside typical hours for some anomalies
-            if np.random.rand() < 0.4: # 40% chance of off-hours activity
-                 date_reported = date_reported.replace(hour=random.choice([0, 1, 2, 3, 4, 5, 6, 22, 23]))
+        The intensity of day d is (1 + volume_trend * d / (days - 1)) * weekday_weights[weekday].
 
-            # Remediation Effectiveness: Can be slower for anomalies
-            assignee_workload = random.uniform(1.0, 2.0) # Simulate higher workload for anomalies
-            severity_factor = {"Low": 1.5, "Medium": 2.0, "High": 3.0, "Critical": 4.0}.get(severity, 2.0)
-            status_factor = 1.5 if status in ["Resolved", "Closed"] else 2.5 # Can take even longer
-            avg_resolution_days = 14 * severity_factor * assignee_workload * status_factor # Higher base
-            issue_response_time_days = max(1, int(np.random.normal(loc=avg_resolution_days, scale=avg_resolution_days/2)))
-            date_resolved = date_reported + timedelta(days=issue_response_time_days) if status in ["Resolved", "Closed"] else self.config.current_date + timedelta(days=random.randint(60,240))
+        Returns:
+            np.ndarray: Cumulative probabilities, one per day from config.start_date.
+        """
+        n_days = max(1, (self.config.end_date - self.config.start_date).days)
+        day = np.arange(n_days)
+        weekday = (self.config.start_date.weekday() + day) % 7
+        intensity = (1 + self.config.volume_trend * day / max(1, n_days - 1)) * np.asarray(self.config.weekday_weights)[weekday]
+        cdf = np.cumsum(intensity)
+        return cdf / cdf[-1]
+
+    def _sample_report_dates(self, rows):
+        """
+        Samples the report dates of normal issues as a datetime64[ns] array.
 
+        Row i of the num_normal_issues rows takes the day at quantile (i + u) / num_normal_issues
+        of the day intensity profile (stratified sampling with uniform u), so the dates cover the
+        whole range in row order and any chunk of rows can be sampled on its own. The hour is
+        drawn from config.hour_weights and the minute uniformly.
 
-            # Feature Dependencies and Realistic Distributions (shifted for anomalies)
-            user_id = random.choice(self.config.users)
-            department_affected = random.choice(self.config.departments)
-            user_profile = self.user_profiles[user_id]
-            department_profile = self.department_profiles[department_affected]
+        Args:
+            rows (np.ndarray): Positions of the rows among all normal issues.
+        """
+        n = len(rows)
+        quantiles = (rows + self.rng.random(n)) / max(1, self.config.num_normal_issues)
+        cdf = self._report_day_cdf()
+        day = np.minimum(np.searchsorted(cdf, quantiles, side="right"), len(cdf) - 1)
+        hour_weights = np.asarray(self.config.hour_weights)
+        hour = self.rng.choice(24, size=n, p=hour_weights / hour_weights.sum())
+        minutes = day * 1440 + hour * 60 + self.rng.integers(0, 60, n)
+        return np.datetime64(self.config.start_date, "ns") + minutes.astype("timedelta64[m]")
+
+    def _assemble_issues_df(self, columns):
+        """
+        Derives the score-dependent columns and builds the issue DataFrame.
 
+        With config.compact_dtypes the label columns become categoricals and the numeric
+        columns are cast to compact_column_dtypes before the threat scoring, so the stored
+        values reproduce the stored scores (Login Attempts is rounded to whole attempts).
 
-            timestamp = date_reported + timedelta(hours=np.random.randint(0, 24), minutes=np.random.randint(0, 60))
+        Args:
+            columns (dict): Column name to array for every generated column except
+                Risk Level, KPI/KRI, Threat Score, Threat Level and Defense Action.
+                The categorical_column_levels columns hold codes into their config lists;
+                "Issue Name" and "Remediation Steps" hold codes into _issue_name_categories().
 
-            activity_type = np.random.choice(self.config.activity_types, p=[0.2, 0.4, 0.4]) # Higher chance of file_access, data_modification
-            user_location = random.choice(self.config.locations) # User location should be generated per issue
-            ip_location = random.choice([loc for loc in self.config.locations if loc != user_location]) # More likely to be from unusual location
+        Returns:
+            pd.DataFrame: Issues with columns in config.columns order.
+        """
+        category_idx = columns["Category"]
+        for name, levels in self.categorical_column_levels.items():
+            columns[name] = self._labels(columns[name], getattr(self.config, levels))
+        issue_names = self._issue_name_categories()[0]
+        columns["Issue Name"] = self._labels(columns["Issue Name"], issue_names)
+        columns["Remediation Steps"] = self._labels(columns["Remediation Steps"], "Steps to resolve " + issue_names)
+        if self.config.compact_dtypes:
+            for name, dtype in self.compact_column_dtypes.items():
+                if name in columns:
+                    values = np.asarray(columns[name])
+                    if values.dtype.kind == "f" and np.issubdtype(dtype, np.integer):
+                        # Round rather than truncate, so the downcast does not shift the distribution
+                        values = np.rint(values)
+                    columns[name] = values.astype(dtype, copy=False)
+        impact_score = columns["Impact Score"]
+
+        # Risk Level Calculation
+        severities = self.config.severities
+        risk_level = np.select([impact_score > 8, impact_score > 5, impact_score > 3],
+                               [severities.index("Critical"), severities.index("High"), severities.index("Medium")],
+                               severities.index("Low"))
+        columns["Risk Level"] = self._labels(risk_level, severities)
+        # KPI/KRI Calculation
+        kpi_kri = np.array([self.filter_kpi_and_kri(c) == 'KRI' for c in self.config.categories], dtype=np.int8)
+        columns["KPI/KRI"] = self._labels(kpi_kri[category_idx], ["KPI", "KRI"])
+
+        columns["Threat Level"], columns["Threat Score"] = self.calculate_threat_levels(
+            columns["Severity"], impact_score, columns["Risk Level"], columns["Issue Response Time Days"],
+            columns["Login Attempts"], columns["Num Files Accessed"], columns["Data Transfer MB"],
+            columns["CPU Usage %"], columns["Memory Usage MB"]
+        )
+        if self.config.compact_dtypes:
+            columns["Threat Score"] = columns["Threat Score"].astype(self.compact_column_dtypes["Threat Score"])
+        columns["Defense Action"] = self.adaptive_defense_mechanisms(
+            columns["Threat Level"], columns["Severity"], columns["Activity Type"],
+            columns["Login Attempts"], columns["Num Files Accessed"], columns["Data Transfer MB"]
+        )
+
+        df = pd.DataFrame({name: columns[name] for name in self.config.columns})
+        if self.config.color_in_generator:
+            df["Color"] = DataProcessor(self.config).threat_severity_colors(df["Threat Level"], df["Severity"])
+        return df
 
 
-            # Session Duration: Exponential distribution, adjusted and potentially shorter/longer for anomalies
-            base_session_duration = 900 # seconds
-            activity_multiplier = {"login": 0.8, "file_access": 2.0, "data_modification": 3.0}.get(activity_type, 1.5)
-            session_duration = max(5, int(np.random.exponential(scale=base_session_duration * activity_multiplier * user_profile['baseline_activity'] * 1.5))) # Higher scale for anomalies
+    def generate_normal_issues_df(self, p_issue_ids, p_issue_keys, p_row_offset=0):
+        """
+        Generates a DataFrame of synthetic normal cybersecurity issue data with enhanced logic.
 
-            # Num Files Accessed: Negative Binomial, adjusted and higher for anomalies
-            base_files_accessed = 20
-            activity_multiplier_files = {"login": 0.5, "file_access": 3.0, "data_modification": 2.5}.get(activity_type, 2.0)
-            num_files_accessed = int(max(5, np.random.negative_binomial(n=5, p=0.3) + base_files_accessed * activity_multiplier_files * user_profile['baseline_activity'] * department_profile['activity_multiplier'] * 2.0)) # Higher mean/variance
+        Every distribution is drawn for the whole batch in one call and the per-row
+        multipliers and clipping are applied as array operations.
 
+        Args:
+            p_issue_ids (array-like): Issue IDs, one per row.
+            p_issue_keys (array-like): Issue keys, one per row.
+            p_row_offset (int): Position of the first row among all normal issues, so a
+                chunk continues the temporal pattern where the previous one stopped.
+        """
+        rng = self.rng
+        n = len(p_issue_ids)
+
+        category = rng.integers(0, len(self.config.categories), n)
+        issue_name = self._issue_name_categories()[1][category]
+        severity = rng.integers(0, len(self.config.severities), n)
+        status = rng.integers(0, len(self.config.statuses), n)
+        reporter = rng.integers(0, len(self.config.reporters), n)
+        assignee = rng.integers(0, len(self.config.assignees), n)
+
+        # Temporal Pattern: Daily/Weekly spikes and overall trend
+        date_reported = self._sample_report_dates(np.arange(n) + p_row_offset)
+
+        # Remediation Effectiveness: Depends on severity, status, and a simulated assignee workload
+        assignee_workload = rng.uniform(0.5, 1.5, n) # Simulate workload
+        severity_factor = self._lookup({"Low": 0.8, "Medium": 1.0, "High": 1.5, "Critical": 2.0}, self.config.severities, 1.0)[severity]
+        resolved = np.isin(self.config.statuses, ["Resolved", "Closed"])[status]
+        status_factor = np.where(resolved, 1.0, 2.0) # Open/In Progress might take longer
+        avg_resolution_days = 7 * severity_factor * assignee_workload * status_factor # Base resolution time
+        issue_response_time_days = np.maximum(1, rng.normal(loc=avg_resolution_days, scale=avg_resolution_days/3).astype(np.int64))
+        # Simulate future resolution for open issues
+        date_resolved = np.where(resolved,
+                                 date_reported + issue_response_time_days.astype("timedelta64[D]"),
+                                 np.datetime64(self.config.current_date, "ns") + rng.integers(30, 181, n).astype("timedelta64[D]"))
+
+        # Feature Dependencies and Realistic Distributions
+        user = rng.integers(0, len(self.config.users), n)
+        department = rng.integers(0, len(self.config.departments), n)
+        baseline_activity, risk_tolerance, baseline_risk, dept_activity_multiplier = self._profile_arrays(user, department)
+
+        timestamp = date_reported + (rng.integers(0, 24, n) * 60 + rng.integers(0, 60, n)).astype("timedelta64[m]")
+
+        activity = rng.integers(0, len(self.config.activity_types), n)
+        user_location = rng.integers(0, len(self.config.locations), n) # User location should be generated per issue
+        ip_location = np.where(rng.random(n) > 0.8, user_location, self._other_location_idx(user_location))
+
+        # Session Duration: Exponential distribution, adjusted by activity type and profiles
+        base_session_duration = 600 # seconds
+        activity_multiplier = self._lookup({"login": 0.5, "file_access": 1.5, "data_modification": 2.0}, self.config.activity_types, 1.0)[activity]
+        session_duration = np.maximum(10, rng.exponential(scale=base_session_duration * activity_multiplier * baseline_activity).astype(np.int64))
+
+        # Num Files Accessed: Poisson or Negative Binomial, adjusted by activity type and profiles
+        base_files_accessed = 5
+        activity_multiplier_files = self._lookup({"login": 0.1, "file_access": 2.0, "data_modification": 1.5}, self.config.activity_types, 1.0)[activity]
+        num_files_accessed = np.maximum(1, rng.poisson(lam=base_files_accessed * activity_multiplier_files * baseline_activity * dept_activity_multiplier))
+
+        # Login Attempts: Negative Binomial (for bursty attempts), adjusted by profiles
+        base_login_attempts = 3
+        login_attempts = np.maximum(1, rng.negative_binomial(n=3, p=0.5, size=n) + base_login_attempts * baseline_activity * baseline_risk)
+
+        # Data Transfer MB: Pareto distribution (few large, many small), adjusted by activity type and profiles
+        base_data_transfer = 10 # MB
+        activity_multiplier_transfer = self._lookup({"login": 0.1, "file_access": 1.5, "data_modification": 2.5}, self.config.activity_types, 1.0)[activity]
+        data_transfer_MB = np.maximum(0.1, rng.pareto(a=2.0, size=n) * base_data_transfer * activity_multiplier_transfer * baseline_activity * dept_activity_multiplier)
+
+        # CPU/Memory Usage: Dependent on activity type and session duration
+        base_cpu = 30
+        base_mem = 4000
+        cpu_usage_percent = np.clip(rng.normal(loc=base_cpu + session_duration/300, scale=10), 1, 100)
+        memory_usage_MB = np.maximum(512, rng.normal(loc=base_mem + session_duration*5, scale=1000))
+
+        # Impact Score and Cost: Dependent on Severity and Category
+        base_impact = 5
+        base_cost = 5000
+        severity_impact_multiplier = self._lookup({"Low": 1.0, "Medium": 1.5, "High": 2.5, "Critical": 4.0}, self.config.severities, 1.0)[severity]
+        category_impact_multiplier = self._lookup({"Data Breach": 3.0, "Malware": 2.0, "Unauthorized Access": 2.5}, self.config.categories, 1.0)[category] # Example category impact
+        impact_score = np.clip(rng.normal(loc=base_impact * severity_impact_multiplier * category_impact_multiplier * risk_tolerance, scale=3).astype(np.int64), 1, 10)
+        cost = np.maximum(100, rng.normal(loc=base_cost * severity_impact_multiplier * category_impact_multiplier * baseline_risk, scale=2000))
+
+        return self._assemble_issues_df({
+            "Issue ID": p_issue_ids, "Issue Key": p_issue_keys,
+            "Issue Name": issue_name, "Issue Volume": np.ones(n, dtype=np.int64),
+            "Category": category, "Severity": severity, "Status": status,
+            "Reporters": reporter, "Assignees": assignee,
+            "Date Reported": date_reported, "Date Resolved": date_resolved,
+            "Issue Response Time Days": issue_response_time_days, "Impact Score": impact_score,
+            "Department Affected": department, "Remediation Steps": issue_name,
+            "Cost": cost, "User ID": user, "Timestamps": timestamp, "Activity Type": activity,
+            "User Location": user_location, "IP Location": ip_location,
+            "Session Duration in Second": session_duration, "Num Files Accessed": num_files_accessed,
+            "Login Attempts": login_attempts, "Data Transfer MB": data_transfer_MB,
+            "CPU Usage %": cpu_usage_percent, "Memory Usage MB": memory_usage_MB,
+        })
 
-            # Login Attempts: Negative Binomial (for bursty attempts), adjusted and much higher for anomalies
-            base_login_attempts = 10
-            login_attempts = max(5, np.random.negative_binomial(n=10, p=0.3) + base_login_attempts * user_profile['baseline_activity'] * department_profile['baseline_risk'] * 3.0) # Much higher mean/variance
 
+    def generate_anomalous_issues_df(self, p_anomalous_issue_ids, p_anomalous_issue_keys):
+        """
+        Generates a DataFrame of synthetic anomalous cybersecurity issue data with enhanced logic.
 
-            # Data Transfer MB: Pareto distribution, adjusted and much higher for anomalies
-            base_data_transfer = 100 # MB
-            activity_multiplier_transfer = {"login": 0.5, "file_access": 2.0, "data_modification": 4.0}.get(activity_type, 2.5)
-            data_transfer_MB = max(1, np.random.pareto(a=1.5) * base_data_transfer * activity_multiplier_transfer * user_profile['baseline_activity'] * department_profile['activity_multiplier'] * 3.0) # Higher scale, lower 'a' for heavier tail
+        Conditional rewrites (off-hours activity, nuanced patterns) are applied as
+        boolean masks over the batch instead of per-row branches.
+        """
+        rng = self.rng
+        n = len(p_anomalous_issue_ids)
+
+        category = rng.integers(0, len(self.config.categories), n)
+        issue_name = self._issue_name_categories()[2][category]
+        severity = rng.choice(len(self.config.severities), size=n, p=[0.05, 0.15, 0.4, 0.4]) # Higher probability for High/Critical
+        status = rng.integers(0, len(self.config.statuses), n)
+        reporter = rng.integers(0, len(self.config.reporters), n)
+        assignee = rng.integers(0, len(self.config.assignees), n)
+
+        # Temporal Pattern: Deviations from normal patterns
+        days = rng.integers(0, max(1, (self.config.end_date - self.config.start_date).days), n)
+        hours = rng.integers(0, 24, n)
+        # Introduce activity outside typical hours for some anomalies
+        off_hours = rng.random(n) < 0.4 # 40% chance of off-hours activity
+        hours = np.where(off_hours, rng.choice([0, 1, 2, 3, 4, 5, 6, 22, 23], size=n), hours)
+        date_reported = np.datetime64(self.config.start_date, "ns") + (
+            days * 1440 + hours * 60 + rng.integers(0, 60, n)).astype("timedelta64[m]")
+
+        # Remediation Effectiveness: Can be slower for anomalies
+        assignee_workload = rng.uniform(1.0, 2.0, n) # Simulate higher workload for anomalies
+        severity_factor = self._lookup({"Low": 1.5, "Medium": 2.0, "High": 3.0, "Critical": 4.0}, self.config.severities, 2.0)[severity]
+        resolved = np.isin(self.config.statuses, ["Resolved", "Closed"])[status]
+        status_factor = np.where(resolved, 1.5, 2.5) # Can take even longer
+        avg_resolution_days = 14 * severity_factor * assignee_workload * status_factor # Higher base
+        issue_response_time_days = np.maximum(1, rng.normal(loc=avg_resolution_days, scale=avg_resolution_days/2).astype(np.int64))
+        date_resolved = np.where(resolved,
+                                 date_reported + issue_response_time_days.astype("timedelta64[D]"),
+                                 np.datetime64(self.config.current_date, "ns") + rng.integers(60, 241, n).astype("timedelta64[D]"))
+
+        # Feature Dependencies and Realistic Distributions (shifted for anomalies)
+        user = rng.integers(0, len(self.config.users), n)
+        department = rng.integers(0, len(self.config.departments), n)
+        baseline_activity, risk_tolerance, baseline_risk, dept_activity_multiplier = self._profile_arrays(user, department)
+
+        timestamp = date_reported + (rng.integers(0, 24, n) * 60 + rng.integers(0, 60, n)).astype("timedelta64[m]")
+
+        activity = rng.choice(len(self.config.activity_types), size=n, p=[0.2, 0.4, 0.4]) # Higher chance of file_access, data_modification
+        user_location = rng.integers(0, len(self.config.locations), n) # User location should be generated per issue
+        ip_location = self._other_location_idx(user_location) # More likely to be from unusual location
+
+        # Session Duration: Exponential distribution, adjusted and potentially shorter/longer for anomalies
+        base_session_duration = 900 # seconds
+        activity_multiplier = self._lookup({"login": 0.8, "file_access": 2.0, "data_modification": 3.0}, self.config.activity_types, 1.5)[activity]
+        session_duration = np.maximum(5, rng.exponential(scale=base_session_duration * activity_multiplier * baseline_activity * 1.5).astype(np.int64)) # Higher scale for anomalies
+
+        # Num Files Accessed: Negative Binomial, adjusted and higher for anomalies
+        base_files_accessed = 20
+        activity_multiplier_files = self._lookup({"login": 0.5, "file_access": 3.0, "data_modification": 2.5}, self.config.activity_types, 2.0)[activity]
+        num_files_accessed = np.maximum(5, rng.negative_binomial(n=5, p=0.3, size=n) + base_files_accessed * activity_multiplier_files * baseline_activity * dept_activity_multiplier * 2.0).astype(np.int64) # Higher mean/variance
+
+        # Login Attempts: Negative Binomial (for bursty attempts), adjusted and much higher for anomalies
+        base_login_attempts = 10
+        login_attempts = np.maximum(5, rng.negative_binomial(n=10, p=0.3, size=n) + base_login_attempts * baseline_activity * baseline_risk * 3.0) # Much higher mean/variance
+
+        # Data Transfer MB: Pareto distribution, adjusted and much higher for anomalies
+        base_data_transfer = 100 # MB
+        activity_multiplier_transfer = self._lookup({"login": 0.5, "file_access": 2.0, "data_modification": 4.0}, self.config.activity_types, 2.5)[activity]
+        data_transfer_MB = np.maximum(1, rng.pareto(a=1.5, size=n) * base_data_transfer * activity_multiplier_transfer * baseline_activity * dept_activity_multiplier * 3.0) # Higher scale, lower 'a' for heavier tail
+
+        # CPU/Memory Usage: Dependent on activity type and session duration, often higher for anomalies
+        base_cpu = 60
+        base_mem = 8000
+        cpu_usage_percent = np.clip(rng.normal(loc=base_cpu + session_duration/200, scale=15), 1, 100)
+        memory_usage_MB = np.maximum(1000, rng.normal(loc=base_mem + session_duration*10, scale=2000))
+
+        # Nuanced Anomalous Patterns: Unusual combinations
+        # Example: High data transfer with very low session duration, or file access from unusual location
+        nuanced = rng.random(n) < 0.3 # 30% chance of injecting this pattern
+        shorten = nuanced & (data_transfer_MB > 1000) & (session_duration < 300)
+        shortened = np.maximum(10, (session_duration * rng.uniform(0.2, 0.5, n)).astype(np.int64))
+        session_duration = np.where(shorten, shortened, session_duration) # Make session duration even shorter
+        force_unusual = (nuanced & (activity == self.config.activity_types.index('file_access'))
+                         & (ip_location == user_location) & (rng.random(n) < 0.5))
+        ip_location = np.where(force_unusual, self._other_location_idx(user_location), ip_location) # Force unusual location
+
+        # Impact Score and Cost: Dependent on Severity and Category, often higher for anomalies
+        base_impact = 7
+        base_cost = 10000
+        severity_impact_multiplier = self._lookup({"Low": 1.5, "Medium": 2.0, "High": 3.0, "Critical": 5.0}, self.config.severities, 2.0)[severity]
+        category_impact_multiplier = self._lookup({"Data Breach": 4.0, "Malware": 3.0, "Unauthorized Access": 3.5}, self.config.categories, 1.5)[category] # Example category impact
+        impact_score = np.clip(rng.normal(loc=base_impact * severity_impact_multiplier * category_impact_multiplier * risk_tolerance * 1.2, scale=4).astype(np.int64), 3, 10)
+        cost = np.maximum(500, rng.normal(loc=base_cost * severity_impact_multiplier * category_impact_multiplier * baseline_risk * 1.5, scale=5000))
+
+        return self._assemble_issues_df({
+            "Issue ID": p_anomalous_issue_ids, "Issue Key": p_anomalous_issue_keys,
+            "Issue Name": issue_name, "Issue Volume": np.ones(n, dtype=np.int64),
+            "Category": category, "Severity": severity, "Status": status,
+            "Reporters": reporter, "Assignees": assignee,
+            "Date Reported": date_reported, "Date Resolved": date_resolved,
+            "Issue Response Time Days": issue_response_time_days, "Impact Score": impact_score,
+            "Department Affected": department, "Remediation Steps": issue_name,
+            "Cost": cost, "User ID": user, "Timestamps": timestamp, "Activity Type": activity,
+            "User Location": user_location, "IP Location": ip_location,
+            "Session Duration in Second": session_duration, "Num Files Accessed": num_files_accessed,
+            "Login Attempts": login_attempts, "Data Transfer MB": data_transfer_MB,
+            "CPU Usage %": cpu_usage_percent, "Memory Usage MB": memory_usage_MB,
+        })
+
+
+    def data_generation_pipeline(self, workers=1, shard_size=100_000):
+        """
+        Generates the normal, anomalous and combined DataFrames.
 
+        The rows are always generated as shards of shard_size rows (see generate_chunks)
+        and merged, so for a given seed the output is the same for any number of workers;
+        `workers` only chooses between this process and a process pool. The combined frame
+        lists the rows shard by shard.
+        """
+        combined_df = pd.concat(list(self.generate_chunks(shard_size, workers=workers)), ignore_index=True)
+        normal_df = combined_df[combined_df["Is Anomaly"] == 0].reset_index(drop=True)
+        anomaly_df = combined_df[combined_df["Is Anomaly"] == 1].reset_index(drop=True)
+        return normal_df, anomaly_df, combined_df
 
-            # CPU/Memory Usage: Dependent on activity type and session duration, often higher for anomalies
-            base_cpu = 60
-            base_mem = 8000
-            cpu_usage_percent = max(1, min(100, np.random.normal(loc=base_cpu + session_duration/200, scale=15)))
-            memory_usage_MB = max(1000, np.random.normal(loc=base_mem + session_duration*10, scale=2000))
+    def _shard_seed_sequence(self, index):
+        """
+        SeedSequence of shard `index`: the child (0, index) of this generator's sequence.
+        Unlike SeedSequence.spawn() it does not advance any counter, so repeated calls give
+        the same shards; incremental runs use the (1, increment) children (see from_state).
+        """
+        return np.random.SeedSequence(self.seed_sequence.entropy,
+                                      spawn_key=(*self.seed_sequence.spawn_key, 0, index))
 
+    def _chunk_plan(self, chunk_size):
+        """
+        Splits the combined rows into chunks of chunk_size rows, each holding normal and
+        anomalous rows in the same proportion as the whole dataset.
 
-            # Nuanced Anomalous Patterns: Unusual combinations
-            # Example: High data transfer with very low session duration, or file access from unusual location
-            if np.random.rand() < 0.3: # 30% chance of injecting this pattern
-                 if data_transfer_MB > 1000 and session_duration < 300:
-                      session_duration = max(10, int(session_duration * np.random.uniform(0.2, 0.5))) # Make session duration even shorter
-                 if activity_type == 'file_access' and ip_location == user_location and np.random.rand() < 0.5:
-                      ip_location = random.choice([loc for loc in self.config.locations if loc != user_location]) # Force unusual location
+        Returns:
+            list: (normal_start, normal_stop, anomalous_start, anomalous_stop) per chunk.
+        """
+        total = self.config.total_issues
+        num_normal = self.config.num_normal_issues
+        plan = []
+        for start in range(0, total, chunk_size):
+            stop = min(start + chunk_size, total)
+            normal_start, normal_stop = start * num_normal // total, stop * num_normal // total
+            plan.append((normal_start, normal_stop, start - normal_start, stop - normal_stop))
+        return plan
+
+    def _generate_chunk(self, normal_start, normal_stop, anomalous_start, anomalous_stop):
+        """Generates one chunk of the combined dataset (see generate_chunks) with self.rng."""
+        normal_df = self.generate_normal_issues_df(*self._issue_ids(normal_start, normal_stop),
+                                                   p_row_offset=normal_start)
+        normal_df["Is Anomaly"] = self._is_anomaly_column(len(normal_df), 0)
+        anomaly_df = self.generate_anomalous_issues_df(*self._issue_ids(anomalous_start, anomalous_stop, anomalous=True))
+        anomaly_df["Is Anomaly"] = self._is_anomaly_column(len(anomaly_df), 1)
+        chunk = pd.concat([normal_df, anomaly_df], ignore_index=True)
+        chunk.index += normal_start + anomalous_start
+        return chunk
+
+    def generate_chunks(self, chunk_size=100_000, workers=1):
+        """
+        Streams the combined dataset as DataFrames of at most chunk_size rows.
 
+        Each chunk interleaves its share of normal and anomalous issues (labelled with
+        "Is Anomaly") and is indexed by its position in the full combined dataset, so
+        only a few chunks have to be held in memory at a time.
 
-            # Impact Score and Cost: Dependent on Severity and Category, often higher for anomalies
-            base_impact = 7
-            base_cost = 10000
-            severity_impact_multiplier = {"Low": 1.5, "Medium": 2.0, "High": 3.0, "Critical": 5.0}.get(severity, 2.0)
-            category_impact_multiplier = {"Data Breach": 4.0, "Malware": 3.0, "Unauthorized Access": 3.5}.get(category, 1.5) # Example category impact
-            impact_score = max(3, min(10, int(np.random.normal(loc=base_impact * severity_impact_multiplier * category_impact_multiplier * user_profile['risk_tolerance'] * 1.2, scale=4))))
-            cost = max(500, np.random.normal(loc=base_cost * severity_impact_multiplier * category_impact_multiplier * department_profile['baseline_risk'] * 1.5, scale=5000))
+        Every chunk is a shard with its own np.random.Generator, seeded from a child of
+        this generator's SeedSequence (config.seed, see _shard_seed_sequence), and all
+        shards share its profile tables. The output therefore depends only on the seed and
+        chunk_size, not on the number of workers or on earlier calls.
 
+        Args:
+            chunk_size (int): Number of rows per chunk.
+            workers (int): Number of processes; 1 generates the shards in this process.
 
-            # Risk Level Calculation (was missing)
-            risk_level = 'Critical' if impact_score > 8 else 'High' if impact_score > 5 else 'Medium' if impact_score > 3 else 'Low'
+        Yields:
+            pd.DataFrame: The next chunk of normal and anomalous issues, in order.
+        """
+        plan = self._chunk_plan(chunk_size)
+        shards = zip(plan, map(self._shard_seed_sequence, range(len(plan))))
+        if workers <= 1:
+            worker = _ShardWorker(self.config, self.user_profiles, self.department_profiles)
+            for shard, seed_sequence in shards:
+                yield worker(shard, seed_sequence)
+            return
 
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_shard_worker,
+                                 initargs=(self.config, self.user_profiles, self.department_profiles)) as pool:
+            # Keep a bounded number of shards in flight so memory does not grow with the dataset
+            pending = deque()
+            for shard, seed_sequence in shards:
+                pending.append(pool.submit(_run_shard, shard, seed_sequence))
+                if len(pending) >= 2 * workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
 
-            # KPI/KRI Calculation (was missing)
-            kpi_kri = self.filter_kpi_and_kri(category)
 
+class _ShardWorker:
+    """Generates shards with a DataGenerator that shares the parent's config and profile tables."""
+    def __init__(self, config, user_profiles, department_profiles):
+        self.generator = DataGenerator(config, user_profiles=user_profiles, department_profiles=department_profiles)
 
-            remediation_steps = f"Steps to resolve {issue_name}" # Remediation Steps (was missing)
+    def __call__(self, shard, seed_sequence):
+        self.generator.rng = np.random.default_rng(seed_sequence)
+        return self.generator._generate_chunk(*shard)
 
-            threat_level, threat_score = self.calculate_threat_level(
-                severity, impact_score, risk_level, issue_response_time_days,
-                login_attempts, num_files_accessed, data_transfer_MB,
-                cpu_usage_percent, memory_usage_MB
-            )
 
-            row_data = {
-                "Severity": severity, "Impact Score": impact_score, "Risk Level": risk_level,
-                "Issue Response Time Days": issue_response_time_days, "Login Attempts": login_attempts,
-                "Num Files Accessed": num_files_accessed, "Data Transfer MB": data_transfer_MB,
-                "CPU Usage %": cpu_usage_percent, "Memory Usage MB": memory_usage_MB,
-                "Threat Level": threat_level, "Activity Type": activity_type
-            }
-            defense_action = self.adaptive_defense_mechanism(row_data)
+_shard_worker = None
 
-            anomalous_issues_data.append([
-                issue_id, issue_key, issue_name, issue_volume, category, severity, status, reporter, assignee,
-                date_reported, date_resolved, issue_response_time_days, impact_score, risk_level, department_affected,
-                remediation_steps, cost, kpi_kri, user_id, timestamp, activity_type, user_location, ip_location,
-                session_duration, num_files_accessed, login_attempts, data_transfer_MB,
-                cpu_usage_percent, memory_usage_MB, threat_score, threat_level, defense_action
-            ])
 
-        df = pd.DataFrame(anomalous_issues_data, columns=self.config.columns)
-        return df
+def _init_shard_worker(config, user_profiles, department_profiles):
+    """Process pool initializer: ships the config and profile tables once per worker process."""
+    global _shard_worker
+    _shard_worker = _ShardWorker(config, user_profiles, department_profiles)
 
 
-    def data_generation_pipeline(self):
-        normal_df = self.generate_normal_issues_df(self.config.issue_ids, self.config.issue_keys)
-        normal_df["Is Anomaly"] = 0
-        anomaly_df = self.generate_anomalous_issues_df(self.anomalous_issue_ids, self.anomalous_issue_keys)
-        anomaly_df["Is Anomaly"] = 1
-        combined_df = pd.concat([normal_df, anomaly_df], ignore_index=True)
-        return normal_df, anomaly_df, combined_df
+def _run_shard(shard, seed_sequence):
+    return _shard_worker(shard, seed_sequence)
 
 
 # =====================================================================
 # Processor
 # =====================================================================
 class DataProcessor:
+    def __init__(self, config=None):
+        self.config = config if config is not None else DataConfig()
+        self._color_table = None
+
+    def _threat_severity_color_table(self):
+        """
+        Builds the (threat level x severity) color code matrix from config.scenario_data.
+
+        Returns:
+            tuple: (code matrix indexed by [threat code, severity code], pd.Index of colors).
+        """
+        if self._color_table is None:
+            scenarios = self.config.scenario_data
+            levels = self.config.severities
+            color_codes, colors = pd.factorize(pd.Series(scenarios["Suggested Color"]))
+            matrix = np.zeros((len(levels), len(levels)), dtype=np.int64)
+            for threat, severity, code in zip(scenarios["Threat Level"], scenarios["Severity"], color_codes):
+                matrix[levels.index(threat), levels.index(severity)] = code
+            self._color_table = matrix, colors
+        return self._color_table
+
+    def threat_severity_colors(self, threat_level, severity):
+        """
+        Looks up the suggested color of every row in the scenario color matrix.
+
+        Unknown threat levels or severities fall back to the "Low" row/column,
+        like the original if/else ladder.
+
+        Args:
+            threat_level (array-like): Threat levels.
+            severity (array-like): Severities.
+
+        Returns:
+            pd.Categorical: Suggested colors.
+        """
+        matrix, colors = self._threat_severity_color_table()
+        low = self.config.severities.index("Low")
+        threat = pd.Categorical(threat_level, categories=self.config.severities).codes
+        severity = pd.Categorical(severity, categories=self.config.severities).codes
+        codes = matrix[np.where(threat < 0, low, threat), np.where(severity < 0, low, severity)]
+        return pd.Categorical.from_codes(codes, categories=colors)
+
     def map_threat_severity_to_color(self, df):
-        def assign_color(threat, severity):
-            if threat == "Critical":
-                if severity == "Critical": return "Dark Red"
-                elif severity == "High": return "Red"
-                elif severity == "Medium": return "Orange-Red"
-                else: return "Orange"
-            elif threat == "High":
-                if severity == "Critical": return "Red"
-                elif severity == "High": return "Orange-Red"
-                elif severity == "Medium": return "Orange"
-                else: return "Yellow-Orange"
-            elif threat == "Medium":
-                if severity == "Critical": return "Orange"
-                elif severity == "High": return "Yellow-Orange"
-                elif severity == "Medium": return "Yellow"
-                else: return "Light Yellow"
-            else:
-                if severity == "Critical": return "Yellow"
-                elif severity == "High": return "Light Yellow"
-                elif severity == "Medium": return "Green-Yellow"
-                else: return "Green"
-        df["Color"] = df.apply(lambda row: assign_color(row["Threat Level"], row["Severity"]), axis=1)
+        df["Color"] = self.threat_severity_colors(df["Threat Level"], df["Severity"])
         return df
 
 
@@ -731,26 +1504,33 @@ class DataDisplay:
     """Handles displaying dataframes."""
     def display_the_data_frames(self, p_normal_issues_df, p_anomalous_issues_df, p_normal_and_anomalous_df,
                                 p_ktis_key_threat_indicators_df, p_scenarios_with_colors_df):
-        """Displays info, description, and head for multiple DataFrames."""
+        """
+        Displays info, description, and head for multiple DataFrames.
+
+        The statistics summaries come from synthetic_data_plot's shared statistics cache,
+        which the EDA plots of the combined frame then reuse instead of rescanning it.
+        """
+        from IPython.display import display
+        from synthetic_data_plot import explaratory_data_analysis_pipeline, describe_statistics
 
         print('Normal_issues_df Data structure\n')
         display(p_normal_issues_df.info())
         print('\nData statistics summary\n')
-        display(p_normal_issues_df.describe().transpose())
+        display(describe_statistics(p_normal_issues_df))
         print('\nNormal_issues_df\n')
         display(p_normal_issues_df.head())
 
         print('\nAnomalous_issues_df Data structure\n')
         display(p_anomalous_issues_df.info())
         print('\nAnomalous_issues_df statistics summary\n')
-        display(p_anomalous_issues_df.describe().transpose())
+        display(describe_statistics(p_anomalous_issues_df))
         print('\nAnomalous_issues_df\n')
         display(p_anomalous_issues_df.head())
 
         print('\nNormal & anomalous combined Data structure\n')
         display(p_normal_and_anomalous_df.info())
         print('\nCombined statistics summary\n')
-        display(p_normal_and_anomalous_df.describe().transpose())
+        display(describe_statistics(p_normal_and_anomalous_df))
         print('\nNormal & anomalous combined Data\n')
         display(p_normal_and_anomalous_df.head())
 
@@ -768,49 +1548,442 @@ class DataDisplay:
 # Saver
 # =====================================================================
 
+def _import_pyarrow():
+    """Imports pyarrow, which is only needed for the Parquet/Feather/Arrow outputs."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet, Feather and Arrow outputs require pyarrow (pip install pyarrow)") from e
+    return pa, pq
+
+
+class _ChecksumSink(io.RawIOBase):
+    """Binary file sink that feeds every written byte into a running hash on its way to disk."""
+    def __init__(self, path, mode, digest):
+        self._file = open(path, mode)
+        self.digest = digest
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.digest.update(data)
+        self._file.write(data)
+        return memoryview(data).nbytes
+
+    def close(self):
+        if not self.closed:
+            self._file.close()
+        super().close()
+
+
 class DataSaver:
-    def save_dataframe(self, df, save_path):
+    """
+    Writes DataFrames as CSV, Parquet, Feather or Arrow IPC, chosen by the file extension.
+
+    The columnar formats keep categoricals as dictionary-encoded columns and
+    timestamps as native timestamp types. Every write is recorded in a manifest
+    (rows, columns, bytes, format, SHA-256 computed while writing, write time), so
+    the summary never has to read the files back.
+
+    append_partitions writes a Hive-style partitioned dataset instead; rows are
+    buffered per partition and flushed as part files once partition_buffer_rows
+    rows are buffered (and on close()).
+    """
+    def __init__(self, parquet_compression="zstd", parquet_compression_level=None, row_group_size=100_000,
+                 partition_buffer_rows=1_000_000):
+        self.parquet_compression = parquet_compression
+        self.parquet_compression_level = parquet_compression_level
+        self.row_group_size = row_group_size
+        self.partition_buffer_rows = partition_buffer_rows
+        self._writers = {}
+        self._outputs = {}
+        # dataset_dir -> {"format", "prefix", "buffers": {partition: [frames]}, "rows", "files": [paths]}
+        self._datasets = {}
+
+    # Lock file marking an output folder as in use by a run (see output_lock)
+    lock_file_name = ".cyberdatagen.lock"
+
+    @staticmethod
+    def file_format(path):
+        return os.path.splitext(path)[1].lstrip(".").lower()
+
+    @classmethod
+    @contextlib.contextmanager
+    def output_lock(cls, folder, run_id):
+        """
+        Holds an exclusive lock file in an output folder for the duration of one run.
+
+        The dataset files, manifest.json and generator_state.json have fixed names in
+        their folder, so two concurrent runs writing to the same folder would overwrite
+        each other's files (only the ZIP archive is named per run). The second run
+        therefore fails instead; concurrent runs need separate output folders.
+
+        Raises:
+            RuntimeError: If another run holds the lock. A run that crashed leaves its
+                lock file behind; delete it once that run is known to be gone.
+        """
+        os.makedirs(folder, exist_ok=True)
+        path = os.path.join(folder, cls.lock_file_name)
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            owner = "another run"
+            with contextlib.suppress(OSError), open(path, encoding="utf-8") as f:
+                owner = f.read().strip() or owner
+            raise RuntimeError(f"{folder} is in use by {owner}. Use another output folder, or delete {path} "
+                               f"if that run is no longer running.") from None
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(f"run {run_id} (pid {os.getpid()})\n")
+        try:
+            yield path
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+
+    def _open_writer(self, sink, file_format, schema):
+        """Opens a Parquet or Arrow IPC file writer (Feather V2 is the IPC file format with lz4)."""
+        pa, pq = _import_pyarrow()
+        if file_format == "parquet":
+            return pq.ParquetWriter(sink, schema, compression=self.parquet_compression,
+                                    compression_level=self.parquet_compression_level)
+        if file_format in ("feather", "arrow"):
+            options = pa.ipc.IpcWriteOptions(compression="lz4" if file_format == "feather" else None)
+            return pa.ipc.new_file(sink, schema, options=options)
+        raise ValueError(f"Unsupported output format {file_format!r}")
+
+    def _write_table(self, writer, table):
+        if isinstance(writer, _import_pyarrow()[1].ParquetWriter):
+            writer.write_table(table, row_group_size=self.row_group_size)
+        else:
+            writer.write_table(table, max_chunksize=self.row_group_size)
+
+    def _to_arrow(self, df, schema=None):
+        pa, _ = _import_pyarrow()
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        return table if schema is None or table.schema.equals(schema) else table.cast(schema)
+
+    def _start_output(self, save_path, extend_existing=False):
+        """
+        Registers a new output in the manifest, replacing any earlier entry for the same path.
+
+        When extend_existing is set and the file exists, the existing rows and bytes are
+        counted and hashed first, so the manifest still describes the whole file.
+        """
         os.makedirs(os.path.dirname(save_path), exist_ok=True)
-        df.to_csv(save_path, index=False)
+        output = {"format": self.file_format(save_path), "rows": 0, "columns": 0,
+                  "write_seconds": 0.0, "digest": hashlib.sha256(), "extends": False}
+        if extend_existing and os.path.exists(save_path):
+            if output["format"] != "csv":
+                raise ValueError(f"Cannot append rows to an existing {output['format']} file {save_path}; "
+                                 "use the CSV output format for incremental runs")
+            lines = 0
+            with open(save_path, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    output["digest"].update(block)
+                    lines += block.count(b"\n")
+            output["rows"], output["extends"] = max(0, lines - 1), True
+        self._outputs[save_path] = output
+        return output
+
+    def _write(self, df, save_path, first_chunk, extend_existing=False):
+        output = self._start_output(save_path, extend_existing) if first_chunk else self._outputs[save_path]
+        started = time.perf_counter()
+        if output["format"] == "csv":
+            overwrite = first_chunk and not output["extends"]
+            with io.TextIOWrapper(io.BufferedWriter(_ChecksumSink(save_path, "wb" if overwrite else "ab", output["digest"])),
+                                  encoding="utf-8", newline="") as handle:
+                df.to_csv(handle, header=overwrite, index=False)
+        elif first_chunk:
+            table = self._to_arrow(df)
+            sink = io.BufferedWriter(_ChecksumSink(save_path, "wb", output["digest"]))
+            self._writers[save_path] = self._open_writer(sink, output["format"], table.schema), table.schema, sink
+            self._write_table(self._writers[save_path][0], table)
+        else:
+            writer, schema, _ = self._writers[save_path]
+            self._write_table(writer, self._to_arrow(df, schema))
+        output["rows"] += len(df)
+        output["columns"] = df.shape[1]
+        output["write_seconds"] += time.perf_counter() - started
+
+    def _close_writer(self, save_path):
+        writer, _, sink = self._writers.pop(save_path)
+        started = time.perf_counter()
+        writer.close()
+        sink.close()
+        self._outputs[save_path]["write_seconds"] += time.perf_counter() - started
+
+    def save_dataframe(self, df, save_path):
+        self._write(df, save_path, first_chunk=True)
+        if save_path in self._writers:
+            self._close_writer(save_path)
         print(f"✅ Saved to {save_path}")
 
-    def print_summary(self, file_paths):
-        summary = []
-        for path in file_paths:
-            if os.path.exists(path):
-                df = pd.read_csv(path)
-                size_kb = os.path.getsize(path) / 1024
-                summary.append([os.path.basename(path), df.shape[0], df.shape[1], f"{size_kb:.1f} KB"])
+    def append_dataframe(self, df, save_path, extend_existing=False):
+        """
+        Appends a chunk to save_path; the first chunk of a run overwrites the file,
+        unless extend_existing is set and save_path is an existing CSV file, whose rows
+        are then kept (incremental runs).
+
+        Columnar files stay open between chunks, so close() must be called once the
+        last chunk has been appended.
+        """
+        first_chunk = save_path not in self._outputs
+        if first_chunk:
+            print(f"✅ {'Appending' if extend_existing else 'Streaming'} to {save_path}")
+        self._write(df, save_path, first_chunk, extend_existing)
+
+    def _serialize(self, df, stream, file_format):
+        """Serializes a DataFrame into a writable binary stream in the given format."""
+        if file_format == "csv":
+            with io.TextIOWrapper(stream, encoding="utf-8", newline="") as handle:
+                df.to_csv(handle, index=False)
+        else:
+            table = self._to_arrow(df)
+            with self._open_writer(stream, file_format, table.schema) as writer:
+                self._write_table(writer, table)
+
+    #------------------------- Partitioned datasets -------------------------
+    @staticmethod
+    def partition_path(day, is_anomaly):
+        """Hive-style partition directory of a report day (datetime64[D]) and anomaly label."""
+        day = str(day)
+        return os.path.join(f"month={day[:7]}", f"day={day[8:10]}", f"is_anomaly={int(is_anomaly)}")
+
+    def append_partitions(self, df, dataset_dir, file_format, part_prefix):
+        """
+        Adds rows to a dataset partitioned by the month and day of "Date Reported" and by
+        "Is Anomaly"; the rows keep all their columns.
+
+        New part files are named part-<part_prefix>-<n>.<file_format>, so a later run with
+        another prefix (e.g. an incremental run) adds files without touching existing ones.
+
+        Args:
+            df (pd.DataFrame): Rows with "Date Reported" and "Is Anomaly" columns.
+            dataset_dir (str): Root directory of the dataset.
+            file_format (str): File format of the part files.
+            part_prefix (str): Unique name of this run, e.g. DataConfig.run_id.
+        """
+        dataset = self._datasets.get(dataset_dir)
+        if dataset is None:
+            print(f"✅ Writing partitions to {dataset_dir}")
+            dataset = self._datasets[dataset_dir] = {"format": file_format, "prefix": part_prefix,
+                                                     "buffers": {}, "rows": 0, "files": []}
+        day = df["Date Reported"].to_numpy().astype("datetime64[D]")
+        keys = day.astype(np.int64) * 2 + df["Is Anomaly"].to_numpy()
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        order = np.argsort(inverse, kind="stable")
+        bounds = np.searchsorted(inverse[order], np.arange(len(unique_keys) + 1))
+        for k, key in enumerate(unique_keys):
+            partition = self.partition_path(np.datetime64(int(key // 2), "D"), key % 2)
+            dataset["buffers"].setdefault(partition, []).append(df.iloc[order[bounds[k]:bounds[k + 1]]])
+        dataset["rows"] += len(df)
+        if dataset["rows"] >= self.partition_buffer_rows:
+            self._flush_partitions(dataset_dir)
+
+    def _flush_partitions(self, dataset_dir):
+        """Writes the buffered rows of every partition of a dataset as new part files."""
+        dataset = self._datasets[dataset_dir]
+        for partition, frames in sorted(dataset["buffers"].items()):
+            part_path = os.path.join(dataset_dir, partition, f"part-{dataset['prefix']}-{len(dataset['files']):05d}.{dataset['format']}")
+            self._write(pd.concat(frames), part_path, first_chunk=True)
+            if part_path in self._writers:
+                self._close_writer(part_path)
+            dataset["files"].append(part_path)
+        dataset["buffers"], dataset["rows"] = {}, 0
+
+    def dataset_files(self, dataset_dir):
+        """Part files written to a partitioned dataset by this saver."""
+        return list(self._datasets[dataset_dir]["files"]) if dataset_dir in self._datasets else []
+
+    def read_partitions(self, dataset_dir, months=None, days=None, is_anomaly=None):
+        """
+        Reads a partitioned dataset, opening only the partitions that match the filters.
+
+        Args:
+            dataset_dir (str): Root directory of the dataset.
+            months (list, optional): Months to read, as "YYYY-MM".
+            days (list, optional): Days to read, as "YYYY-MM-DD" strings or dates.
+            is_anomaly (int, optional): 0 for the normal rows, 1 for the anomalous rows.
+
+        Returns:
+            pd.DataFrame: The matching rows.
+        """
+        days = None if days is None else {str(np.datetime64(day, "D")) for day in days}
+
+        def values(path, key):
+            return sorted(name.split("=", 1)[1] for name in os.listdir(path) if name.startswith(f"{key}="))
+
+        frames = []
+        for month in values(dataset_dir, "month"):
+            if months is not None and month not in months:
+                continue
+            for day in values(os.path.join(dataset_dir, f"month={month}"), "day"):
+                if days is not None and f"{month}-{day}" not in days:
+                    continue
+                for anomaly in (0, 1) if is_anomaly is None else (int(is_anomaly),):
+                    partition = os.path.join(dataset_dir, f"month={month}", f"day={day}", f"is_anomaly={anomaly}")
+                    if os.path.isdir(partition):
+                        frames.extend(self.read_dataframe(os.path.join(partition, name)) for name in sorted(os.listdir(partition)))
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+    def close(self):
+        """Finalizes the files opened by append_dataframe and flushes the buffered partitions."""
+        for save_path in list(self._writers):
+            self._close_writer(save_path)
+        for dataset_dir in self._datasets:
+            self._flush_partitions(dataset_dir)
+
+    def read_dataframe(self, path):
+        """Reads a file written by this saver back into a DataFrame."""
+        file_format = self.file_format(path)
+        if file_format == "csv":
+            return pd.read_csv(path)
+        pa, pq = _import_pyarrow()
+        if file_format == "parquet":
+            return pq.read_table(path).to_pandas()
+        with pa.memory_map(path) as source:
+            return pa.ipc.open_file(source).read_all().to_pandas()
+
+    def manifest(self, file_paths=None):
+        """
+        Describes the files written by this saver.
+
+        Args:
+            file_paths (list, optional): Restrict (and order) the entries to these paths.
+
+        Returns:
+            list: One dict per file with path, file, format, rows, columns, bytes, sha256 and write_seconds.
+        """
+        entries = []
+        paths = self._outputs if file_paths is None else [
+            part for path in file_paths for part in (self.dataset_files(path) if path in self._datasets else [path])]
+        for path in paths:
+            output = self._outputs.get(path)
+            if output is None or path in self._writers:
+                continue
+            dataset = next((d for d in self._datasets if path.startswith(d + os.sep)), None)
+            entries.append({
+                "path": path, "file": os.path.relpath(path, os.path.dirname(dataset)) if dataset else os.path.basename(path),
+                "format": output["format"], "dataset": dataset,
+                "rows": output["rows"], "columns": output["columns"], "bytes": os.path.getsize(path),
+                "sha256": output["digest"].hexdigest(), "write_seconds": round(output["write_seconds"], 6)
+            })
+        return entries
+
+    def write_manifest(self, manifest_path, file_paths=None, keep_existing=False):
+        """
+        Writes the manifest as JSON to manifest_path.
+
+        With keep_existing, the entries of an existing manifest whose files still exist and
+        were not rewritten are kept, e.g. the part files of earlier incremental runs.
+        """
+        os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+        entries = self.manifest(file_paths)
+        if keep_existing and os.path.exists(manifest_path):
+            with open(manifest_path, encoding="utf-8") as f:
+                previous = json.load(f)["files"]
+            written = {entry["path"] for entry in entries}
+            entries = [entry for entry in previous if entry["path"] not in written and os.path.exists(entry["path"])] + entries
+        with open(manifest_path, "w", encoding="utf-8") as f:
+            json.dump({"created": datetime.now().isoformat(timespec="seconds"), "files": entries}, f, indent=2)
+        print(f"✅ Manifest saved to {manifest_path}")
+
+    def print_summary(self, file_paths=None):
+        summary, datasets = [], {}
+        for entry in self.manifest(file_paths):
+            if entry["dataset"] is None:
+                summary.append([entry["file"], entry["rows"], entry["columns"], f"{entry['bytes'] / 1024:.1f} KB",
+                                f"{entry['write_seconds']:.2f} s", entry["sha256"][:12]])
+            else:
+                # The part files of a partitioned dataset are summarized in one line
+                datasets.setdefault(entry["dataset"], []).append(entry)
+        for dataset, entries in datasets.items():
+            summary.append([f"{os.path.basename(dataset)}/ ({len(entries)} files)", sum(e["rows"] for e in entries),
+                            entries[0]["columns"], f"{sum(e['bytes'] for e in entries) / 1024:.1f} KB",
+                            f"{sum(e['write_seconds'] for e in entries):.2f} s", "see manifest"])
         print("\n📊 Dataset Summary")
-        print(pd.DataFrame(summary, columns=["File", "Rows", "Columns", "Size"]).to_string(index=False))
+        print(pd.DataFrame(summary, columns=["File", "Rows", "Columns", "Size", "Write Time", "SHA-256"]).to_string(index=False))
+
+    zip_compressions = {"stored": zipfile.ZIP_STORED, "deflate": zipfile.ZIP_DEFLATED,
+                        "bzip2": zipfile.ZIP_BZIP2, "lzma": zipfile.ZIP_LZMA}
+    if hasattr(zipfile, "ZIP_ZSTANDARD"):  # Python 3.14+
+        zip_compressions["zstd"] = zipfile.ZIP_ZSTANDARD
+
+    def write_archive(self, zip_path, file_paths=(), frames=None, compression="deflate", compression_level=None):
+        """
+        Writes a ZIP archive without intermediate copies.
+
+        Files are streamed into their entries and DataFrames are serialized straight
+        into theirs. The archive is written under a temporary name and renamed when
+        complete, so nobody sees a partial archive.
+
+        Args:
+            zip_path (str): Destination of the archive.
+            file_paths (list): Existing files to add, stored under their base names; directories
+                (partitioned datasets) are added with all their files, relative to their parent.
+            frames (dict, optional): Entry name -> DataFrame; the entry extension selects the format.
+            compression (str): One of zip_compressions.
+            compression_level (int, optional): Compression level passed to zipfile.
+
+        Returns:
+            str: zip_path.
+        """
+        if compression not in self.zip_compressions:
+            raise ValueError(f"Unsupported ZIP compression {compression!r} on this Python, "
+                             f"expected one of {list(self.zip_compressions)}")
+        os.makedirs(os.path.dirname(zip_path), exist_ok=True)
+        part_path = f"{zip_path}.{os.getpid()}.part"
+        with zipfile.ZipFile(part_path, "w", compression=self.zip_compressions[compression],
+                             compresslevel=compression_level, allowZip64=True) as archive:
+            for path in file_paths:
+                if os.path.isdir(path):
+                    for root, _, names in sorted(os.walk(path)):
+                        for name in sorted(names):
+                            archive.write(os.path.join(root, name),
+                                          arcname=os.path.relpath(os.path.join(root, name), os.path.dirname(path)))
+                else:
+                    archive.write(path, arcname=os.path.basename(path))
+            for arcname, df in (frames or {}).items():
+                with archive.open(arcname, "w", force_zip64=True) as entry:
+                    self._serialize(df, entry, self.file_format(arcname))
+        os.replace(part_path, zip_path)
+        return zip_path
 
     def save_data_option(self, config, no_prompt=False, auto_download=False):
-        """Optionally download a ZIP of the datasets."""
-        temp_dir = "/tmp/cybersecurity_data"
-        zip_path = "/tmp/cybersecurity_data.zip"
+        """
+        Optionally download a ZIP of the datasets.
+
+        Returns:
+            str or None: Path of the archive, or None when none was written.
+        """
+        zip_path = config.zip_file
 
         def make_zip():
-            os.makedirs(temp_dir, exist_ok=True)
-            shutil.copy(config.normal_data_file, temp_dir)
-            shutil.copy(config.anomalous_data_file, temp_dir)
-            shutil.copy(config.combined_data_file, temp_dir)
-            shutil.copy(config.key_threat_indicators_file, temp_dir)
-            shutil.copy(config.scenarios_with_colors_file, temp_dir)
-            shutil.make_archive("/tmp/cybersecurity_data", 'zip', temp_dir)
+            datasets = ([config.dataset_dir] if config.layout == "partitioned" else
+                        [config.normal_data_file, config.anomalous_data_file, config.combined_data_file])
+            self.write_archive(zip_path, datasets + [config.key_threat_indicators_file,
+                                                     config.scenarios_with_colors_file, config.manifest_file],
+                               compression=config.zip_compression, compression_level=config.zip_compression_level)
+
+        def download():
+            files = _colab_files()
+            if files is not None:
+                files.download(zip_path)
+                print(f"Files downloaded locally as {os.path.basename(zip_path)}")
+            else:
+                print(f"ZIP created at {zip_path} (please download manually).")
 
         # Auto mode (no user interaction)
         if no_prompt:
             print("Skipping local download (no-prompt mode).")
-            return
+            return None
         if auto_download:
             print("Preparing files for automatic download...")
             make_zip()
-            if COLAB:
-                files.download(zip_path)
-                print("Files downloaded locally as cybersecurity_data.zip")
-            else:
-                print(f"ZIP created at {zip_path} (please download manually).")
-            return
+            download()
+            return zip_path
 
         # Interactive prompt
         while True:
@@ -818,58 +1991,298 @@ class DataSaver:
             if choice == 'yes':
                 print("Preparing files for download...")
                 make_zip()
-                if COLAB:
-                    files.download(zip_path)
-                    print("Files downloaded locally as cybersecurity_data.zip")
-                else:
-                    print(f"ZIP created at {zip_path} (please download manually).")
-                break
+                download()
+                return zip_path
             elif choice == 'no':
                 print("Files saved to repository only. No local download.")
-                break
+                return None
             else:
                 print("Invalid choice. Please enter 'yes' or 'no'.")
 
 
 # =====================================================================
-# Main pipeline
+# Instrumentation
 # =====================================================================
-def cybersecurity_data_pipeline(show_data=True, no_prompt=False, auto_download=False):
-    config = DataConfig()
-    generator = DataGenerator(config)
-    processor = DataProcessor()
-    saver = DataSaver()
-    display_handler = DataDisplay()
-
-    normal_df, anomaly_df, combined_df = generator.data_generation_pipeline()
-    combined_df = processor.map_threat_severity_to_color(combined_df)
-
-    # Display if requested
-    if show_data:
-        display_handler.display_the_data_frames(
-            normal_df, anomaly_df, combined_df,
-            config.ktis_key_threat_indicators_df,
-            config.scenarios_with_colors_df
-        )
+def _peak_rss_mb():
+    """High-water mark of this process' resident memory in MB, or None without the resource module."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if os.uname().sysname == "Darwin" else 1024), 1)
+
+
+class PipelineMetrics:
+    """
+    Records wall time, CPU time, rows, bytes and peak memory per pipeline stage.
+
+    A stage can be entered several times (e.g. once per chunk); its measurements add up.
+    Every finished stage entry is passed to the callbacks and, when enabled, logged as
+    a JSON line on the "cyberdatagen" logger; write() saves all stages as JSON.
+
+    Args:
+        profile_stage (str, optional): Name of a stage to profile.
+        profiler (str): "cprofile" or "pyinstrument" (must be installed).
+        profile_dir (str, optional): Where the profile of profile_stage is saved; printed when None.
+        trace_memory (bool): Also record the peak of Python/NumPy allocations per stage
+            with tracemalloc (exact, but slows allocation-heavy stages down).
+        log (bool): Log every stage entry as a structured record.
+        callbacks (list): Callables receiving (stage name, record) after every stage entry.
+    """
+    profilers = ["cprofile", "pyinstrument"]
+
+    def __init__(self, profile_stage=None, profiler="cprofile", profile_dir=None, trace_memory=False,
+                 log=False, callbacks=()):
+        if profiler not in self.profilers:
+            raise ValueError(f"Unsupported profiler {profiler!r}, expected one of {self.profilers}")
+        self.profile_stage = profile_stage
+        self.profiler = profiler
+        self.profile_dir = profile_dir
+        self.trace_memory = trace_memory
+        self.log = log
+        self.callbacks = list(callbacks)
+        self.stages = {}
+
+    def _start_profiler(self):
+        if self.profiler == "pyinstrument":
+            from pyinstrument import Profiler
+            profiler = Profiler()
+            profiler.start()
+            return profiler
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+        return profiler
+
+    def _stop_profiler(self, profiler, name):
+        if self.profiler == "pyinstrument":
+            profiler.stop()
+            if self.profile_dir is None:
+                print(profiler.output_text())
+                return
+            path = os.path.join(self.profile_dir, f"profile-{name}.html")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(profiler.output_html())
+        else:
+            profiler.disable()
+            import pstats
+            if self.profile_dir is None:
+                pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
+                return
+            path = os.path.join(self.profile_dir, f"profile-{name}.prof")
+            profiler.dump_stats(path)
+        print(f"✅ Profile of stage {name!r} saved to {path}")
+
+    @contextlib.contextmanager
+    def stage(self, name, rows=0):
+        """
+        Measures the enclosed block as (one entry of) stage `name`.
 
-    # Save all datasets
-    saver.save_dataframe(normal_df, config.normal_data_file)
-    saver.save_dataframe(anomaly_df, config.anomalous_data_file)
-    saver.save_dataframe(combined_df, config.combined_data_file)
-    saver.save_dataframe(config.ktis_key_threat_indicators_df, config.key_threat_indicators_file)
-    saver.save_dataframe(config.scenarios_with_colors_df, config.scenarios_with_colors_file)
+        Yields:
+            dict: The entry's record; set "rows" or "bytes" on it to count work done inside.
+        """
+        record = {"rows": rows, "bytes": 0}
+        profiler = self._start_profiler() if name == self.profile_stage else None
+        if self.trace_memory:
+            import tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield record
+        finally:
+            record["wall_seconds"] = time.perf_counter() - wall
+            record["cpu_seconds"] = time.process_time() - cpu
+            record["peak_rss_mb"] = _peak_rss_mb()
+            if self.trace_memory:
+                record["peak_traced_mb"] = round(tracemalloc.get_traced_memory()[1] / 2**20, 1)
+            if profiler is not None:
+                self._stop_profiler(profiler, name)
+            self._add(name, record)
+
+    def iterate(self, name, iterable):
+        """Yields the items of iterable, timing each step as stage `name` and counting rows of DataFrames."""
+        iterator = iter(iterable)
+        while True:
+            with self.stage(name) as record:
+                item = next(iterator, None)
+                record["rows"] = 0 if item is None else len(item)
+            if item is None:
+                return
+            yield item
+
+    def _add(self, name, record):
+        total = self.stages.setdefault(name, {"calls": 0, "rows": 0, "bytes": 0, "wall_seconds": 0.0,
+                                               "cpu_seconds": 0.0, "peak_rss_mb": None})
+        total["calls"] += 1
+        for key in ("rows", "bytes", "wall_seconds", "cpu_seconds"):
+            total[key] += record[key]
+        for key in ("peak_rss_mb", "peak_traced_mb"):
+            if record.get(key) is not None:
+                total[key] = max(total.get(key) or 0, record[key])
+        if self.log:
+            logger.info(json.dumps({"stage": name, **record}, default=str))
+        for callback in self.callbacks:
+            callback(name, record)
+
+    def to_dict(self):
+        """Per-stage totals, with rows_per_second, in stage order."""
+        return {name: {**total, "wall_seconds": round(total["wall_seconds"], 6), "cpu_seconds": round(total["cpu_seconds"], 6),
+                       "rows_per_second": round(total["rows"] / total["wall_seconds"]) if total["rows"] and total["wall_seconds"] else None}
+                for name, total in self.stages.items()}
+
+    def write(self, path):
+        """Writes the per-stage totals as JSON to path."""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"created": datetime.now().isoformat(timespec="seconds"), "stages": self.to_dict()}, f, indent=2)
+        print(f"✅ Metrics saved to {path}")
+
+    def print_summary(self):
+        rows = [[name, total["calls"], total["rows"], f"{total['wall_seconds']:.2f} s", f"{total['cpu_seconds']:.2f} s",
+                 total["rows_per_second"] or "", total["peak_rss_mb"] or ""]
+                for name, total in self.to_dict().items()]
+        print("\n⏱ Stage Timings")
+        print(pd.DataFrame(rows, columns=["Stage", "Calls", "Rows", "Wall", "CPU", "Rows/s", "Peak RSS MB"]).to_string(index=False))
 
-    # Print summary
-    saver.print_summary([
-        config.normal_data_file,
-        config.anomalous_data_file,
-        config.combined_data_file,
-        config.key_threat_indicators_file,
-        config.scenarios_with_colors_file
-    ])
 
-    # Prompt or auto ZIP download
-    saver.save_data_option(config, no_prompt=no_prompt, auto_download=auto_download)
+# =====================================================================
+# Main pipeline
+# =====================================================================
+def cybersecurity_data_pipeline(show_data=True, no_prompt=False, auto_download=False, chunk_size=None,
+                                workers=1, seed=None, output_format=None, zip_compression=None, config=None,
+                                append_days=None, metrics=None, metrics_file=None):
+    """
+    Generates, displays and saves the datasets.
+
+    With chunk_size set, the data is generated in chunks of that many rows and each
+    chunk is appended to the normal, anomalous and combined outputs as it arrives,
+    so memory stays bounded by the chunk size instead of the dataset size. The
+    chunks are generated on `workers` processes. `seed` makes the output reproducible.
+    `output_format` is one of DataConfig.output_formats and `zip_compression` one of
+    DataSaver.zip_compressions.
+
+    `config` defaults to DataConfig.load() (environment variables over the defaults);
+    `seed`, `output_format` and `zip_compression` override it when given.
+
+    Every run saves the generator state to config.state_file. With `append_days`, the
+    run instead continues the dataset of that state for `append_days` more days (see
+    DataGenerator.from_state) and appends the new rows to the existing CSV outputs.
+
+    With config.layout == "partitioned" the combined rows are written once, as a dataset
+    partitioned by report month/day and "Is Anomaly" under config.dataset_dir, instead of
+    the normal, anomalous and combined files; incremental runs then add part files in any
+    output format.
+
+    Every stage (setup, generate, color_map, display, save, summary, zip) is measured by
+    `metrics` (a PipelineMetrics, created when None), which is returned; `metrics_file`
+    saves its per-stage totals as JSON.
+
+    The output files have fixed names in config.github_repo_folder, so a run holds a
+    lock on that folder (DataSaver.output_lock) and a concurrent run into the same
+    folder raises RuntimeError; concurrent runs need separate folders.
+    """
+    if workers > 1 and not chunk_size:
+        chunk_size = 100_000
+    metrics = metrics if metrics is not None else PipelineMetrics()
+    # Closed (releasing the output folder lock) after the last stage
+    with contextlib.ExitStack() as run:
+        with metrics.stage("setup"):
+            config = config if config is not None else DataConfig.load(overrides={"seed": seed})
+            overrides = {"seed": seed, "output_format": output_format, "zip_compression": zip_compression}
+            config = config.replace(**{name: value for name, value in overrides.items() if value is not None})
+            # One run at a time per output folder, see DataSaver.output_lock
+            run.enter_context(DataSaver.output_lock(config.github_repo_folder, config.run_id))
+            if append_days:
+                generator = DataGenerator.from_state(config.state_file, append_days, config)
+                config = generator.config
+                print(f"Appending {config.total_issues} issues from {config.start_date:%Y-%m-%d} to {config.end_date:%Y-%m-%d}")
+            else:
+                generator = DataGenerator(config)
+        extend_existing = bool(append_days)
+        partitioned = config.layout == "partitioned"
+        processor = DataProcessor(config)
+        saver = DataSaver(config.parquet_compression, config.parquet_compression_level, config.row_group_size)
+        display_handler = DataDisplay()
+
+        if chunk_size:
+            if show_data:
+                print("Skipping DataFrame display in streaming mode.")
+            try:
+                for chunk in metrics.iterate("generate", generator.generate_chunks(chunk_size, workers=workers)):
+                    if not partitioned:
+                        with metrics.stage("save"):
+                            saver.append_dataframe(chunk[chunk["Is Anomaly"] == 0], config.normal_data_file, extend_existing)
+                            saver.append_dataframe(chunk[chunk["Is Anomaly"] == 1], config.anomalous_data_file, extend_existing)
+                    if not config.color_in_generator:
+                        with metrics.stage("color_map", len(chunk)):
+                            chunk = processor.map_threat_severity_to_color(chunk)
+                    with metrics.stage("save", len(chunk)):
+                        if partitioned:
+                            saver.append_partitions(chunk, config.dataset_dir, config.output_format, config.run_id)
+                        else:
+                            saver.append_dataframe(chunk, config.combined_data_file, extend_existing)
+            finally:
+                with metrics.stage("save"):
+                    saver.close()
+        else:
+            with metrics.stage("generate", config.total_issues):
+                normal_df, anomaly_df, combined_df = generator.data_generation_pipeline()
+            if not config.color_in_generator:
+                with metrics.stage("color_map", len(combined_df)):
+                    combined_df = processor.map_threat_severity_to_color(combined_df)
+
+            # Display if requested
+            if show_data:
+                with metrics.stage("display"):
+                    display_handler.display_the_data_frames(
+                        normal_df, anomaly_df, combined_df,
+                        config.ktis_key_threat_indicators_df,
+                        config.scenarios_with_colors_df
+                    )
+
+            # Save all datasets
+            with metrics.stage("save", len(combined_df)):
+                if partitioned:
+                    saver.append_partitions(combined_df, config.dataset_dir, config.output_format, config.run_id)
+                    saver.close()
+                elif extend_existing:
+                    saver.append_dataframe(normal_df, config.normal_data_file, extend_existing)
+                    saver.append_dataframe(anomaly_df, config.anomalous_data_file, extend_existing)
+                    saver.append_dataframe(combined_df, config.combined_data_file, extend_existing)
+                    saver.close()
+                else:
+                    saver.save_dataframe(normal_df, config.normal_data_file)
+                    saver.save_dataframe(anomaly_df, config.anomalous_data_file)
+                    saver.save_dataframe(combined_df, config.combined_data_file)
+        datasets = ([config.dataset_dir] if partitioned else
+                    [config.normal_data_file, config.anomalous_data_file, config.combined_data_file])
+        output_files = datasets + [
+            config.key_threat_indicators_file,
+            config.scenarios_with_colors_file
+        ]
+        with metrics.stage("save") as record:
+            saver.save_dataframe(config.ktis_key_threat_indicators_df, config.key_threat_indicators_file)
+            saver.save_dataframe(config.scenarios_with_colors_df, config.scenarios_with_colors_file)
+            # Bytes of all saved outputs, from the manifest (no file is read back); set inside
+            # the stage so that callbacks and logged records see them too
+            record["bytes"] = sum(entry["bytes"] for entry in saver.manifest(output_files))
+
+        # Print summary and write the manifest of what was saved
+        with metrics.stage("summary"):
+            saver.print_summary(output_files)
+            saver.write_manifest(config.manifest_file, output_files, keep_existing=extend_existing)
+            generator.save_state(config.state_file)
+        # Prompt or auto ZIP download (includes the time spent waiting for an answer)
+        with metrics.stage("zip") as record:
+            zip_path = saver.save_data_option(config, no_prompt=no_prompt, auto_download=auto_download)
+            if zip_path is not None:
+                record["bytes"] = os.path.getsize(zip_path)
+
+        metrics.print_summary()
+    if metrics_file:
+        metrics.write(metrics_file)
+    return metrics
 
 
 if __name__ == "__main__":
@@ -877,11 +2290,68 @@ if __name__ == "__main__":
     parser.add_argument("--no-prompt", action="store_true", help="Skip download prompt")
     parser.add_argument("--auto-download", action="store_true", help="Auto-download ZIP without prompt")
     parser.add_argument("--no-display", action="store_true", help="Skip DataFrame display")
+    parser.add_argument("--chunk-size", type=int, default=None,
+                        help="Stream the data in chunks of this many rows (bounded memory)")
+    parser.add_argument("--workers", type=int, default=1, help="Number of processes generating chunks")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for reproducible output")
+    parser.add_argument("--output-format", choices=DataConfig.output_formats, default=None,
+                        help="File format of the saved datasets (default: csv)")
+    parser.add_argument("--layout", choices=DataConfig.layouts, default=None,
+                        help="Separate normal/anomalous/combined files, or one dataset partitioned by month/day/anomaly")
+    parser.add_argument("--zip-compression", choices=list(DataSaver.zip_compressions), default=None,
+                        help="Compression of the download ZIP archive (default: deflate)")
+    parser.add_argument("--config", default=None,
+                        help="JSON file of DataConfig fields; environment variables and flags override it")
+    parser.add_argument("--num-normal-issues", type=int, default=None, help="Number of normal issues")
+    parser.add_argument("--num-anomalous-issues", type=int, default=None, help="Number of anomalous issues")
+    parser.add_argument("--num-users", type=int, default=None, help="Number of users")
+    parser.add_argument("--num-departments", type=int, default=None, help="Number of department profiles")
+    parser.add_argument("--start-date", type=datetime.fromisoformat, default=None,
+                        help="First report date (YYYY-MM-DD)")
+    parser.add_argument("--end-date", type=datetime.fromisoformat, default=None,
+                        help="Last report date (YYYY-MM-DD, default: today)")
+    parser.add_argument("--current-date", type=datetime.fromisoformat, default=None,
+                        help="Reference date of open issues' resolution dates (default: the end date)")
+    parser.add_argument("--output-dir", default=None, help="Directory of the saved datasets")
+    parser.add_argument("--metrics-file", default=None, help="Save per-stage timings and counters as JSON")
+    parser.add_argument("--log-metrics", action="store_true", help="Log every stage as a JSON record on stderr")
+    parser.add_argument("--profile-stage", default=None,
+                        help="Profile one stage (setup, generate, color_map, display, save, summary, zip)")
+    parser.add_argument("--profiler", choices=PipelineMetrics.profilers, default="cprofile",
+                        help="Profiler used by --profile-stage")
+    parser.add_argument("--trace-memory", action="store_true", help="Record per-stage peak allocations with tracemalloc")
+    parser.add_argument("--append-days", type=int, default=None,
+                        help="Extend the existing dataset in the output directory by this many days")
 
     args = parser.parse_args()
+    if args.log_metrics:
+        logging.basicConfig(level=logging.INFO, format="%(message)s")
+    config = DataConfig.load(args.config, overrides={
+        "num_normal_issues": args.num_normal_issues,
+        "num_anomalous_issues": args.num_anomalous_issues,
+        "num_users": args.num_users,
+        "num_departments": args.num_departments,
+        "start_date": args.start_date,
+        "end_date": args.end_date,
+        "current_date": args.current_date,
+        "seed": args.seed,
+        "github_repo_folder": args.output_dir,
+        "layout": args.layout,
+    })
 
     cybersecurity_data_pipeline(
         show_data=not args.no_display,
         no_prompt=args.no_prompt,
-        auto_download=args.auto_download
+        auto_download=args.auto_download,
+        chunk_size=args.chunk_size,
+        workers=args.workers,
+        seed=args.seed,
+        output_format=args.output_format,
+        zip_compression=args.zip_compression,
+        config=config,
+        append_days=args.append_days,
+        metrics=PipelineMetrics(profile_stage=args.profile_stage, profiler=args.profiler,
+                                profile_dir=os.path.dirname(os.path.abspath(args.metrics_file)) if args.metrics_file else None,
+                                trace_memory=args.trace_memory, log=args.log_metrics),
+        metrics_file=args.metrics_file
     )
@@ -2,6 +2,10 @@
 # =======================
 # Required Libraries
 # =======================
+import os
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
@@ -22,7 +26,548 @@ def normalize_numerical_features(p_df):
 
 
 #------------------------------------------------------------------
-def plot_numerical_features_daily_values(df, date_column, feature_columns, rows, cols):
+# Shared statistics: one pass per numeric column computes its moments, quantiles and
+# histogram bin counts, cached per DataFrame for all plots and summaries.
+_statistics_cache = {}
+# Rows per block of the moment computation, bounding its temporaries
+STATISTICS_BLOCK_ROWS = 1_000_000
+
+
+def compute_statistics(df, bins=30, quantiles=(0.25, 0.5, 0.75)):
+    """
+    Computes count, mean, std, skewness, kurtosis, min, quantiles and max of every
+    numeric column, plus fixed-bin histogram counts.
+
+    Columns are processed one at a time, and their moments in blocks of
+    STATISTICS_BLOCK_ROWS rows merged with merge_moments, so the memory used on top
+    of df is about two float64 copies of one column. Skewness and kurtosis are the
+    bias-corrected estimators of pandas' skew()/kurtosis().
+
+    Returns:
+        dict: "summary" (DataFrame indexed by column) and "histograms"
+              (column -> (counts, bin edges)).
+    """
+    columns = [column for column in df.columns
+               if pd.api.types.is_numeric_dtype(df[column]) and not pd.api.types.is_bool_dtype(df[column])]
+    moments, quantile_values, histograms = [], [], {}
+    for column in columns:
+        values = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+        total = (0.0, 0.0, 0.0, 0.0, 0.0)
+        for start in range(0, len(values), STATISTICS_BLOCK_ROWS):
+            total = merge_moments(total, block_moments(values[start:start + STATISTICS_BLOCK_ROWS]))
+        moments.append(total)
+        present = values[~np.isnan(values)]
+        del values
+        histograms[column] = np.histogram(present, bins=bins)
+        # The quantiles may reorder `present` in place, it is not used afterwards
+        quantile_values.append(np.quantile(present, [0.0, *quantiles, 1.0], overwrite_input=True) if len(present)
+                               else np.full(len(quantiles) + 2, np.nan))
+        del present
+
+    n, mean, m2, m3, m4 = np.array(moments, dtype=np.float64).reshape(len(columns), 5).T
+    with np.errstate(divide='ignore', invalid='ignore'):
+        summary = _summary_from_moments(columns, n, np.where(n > 0, mean, np.nan), m2 / n, m3 / n, m4 / n)
+    quantile_values = np.array(quantile_values).reshape(len(columns), len(quantiles) + 2).T
+    summary["min"], summary["max"] = quantile_values[0], quantile_values[-1]
+    for q, row in zip(quantiles, quantile_values[1:-1]):
+        summary[f"{q:.0%}"] = row
+    return {"summary": summary, "histograms": histograms}
+
+
+def block_moments(values):
+    """(n, mean, sums of the 2nd/3rd/4th powers of the deviations) of a 1-D block, ignoring NaN."""
+    values = values[~np.isnan(values)]
+    if not len(values):
+        return (0.0, 0.0, 0.0, 0.0, 0.0)
+    mean = values.mean()
+    centered = values - mean
+    squared = centered * centered
+    return (float(len(values)), mean, squared.sum(), (squared * centered).sum(), (squared * squared).sum())
+
+
+def merge_moments(a, b):
+    """
+    Chan/Pebay pairwise update: merges two (n, mean, M2, M3, M4) moment tuples, where Mk
+    is the sum of the k-th powers of the deviations from the mean. Works on scalars and
+    on arrays with one entry per column.
+    """
+    n_a, mean_a, m2_a, m3_a, m4_a = a
+    n_b, mean_b, m2_b, m3_b, m4_b = b
+    n = n_a + n_b
+    safe_n = np.where(n > 0, n, 1)
+    delta = mean_b - mean_a
+    mean = mean_a + delta * n_b / safe_n
+    m2 = m2_a + m2_b + delta ** 2 * n_a * n_b / safe_n
+    m3 = (m3_a + m3_b + delta ** 3 * n_a * n_b * (n_a - n_b) / safe_n ** 2
+          + 3 * delta * (n_a * m2_b - n_b * m2_a) / safe_n)
+    m4 = (m4_a + m4_b + delta ** 4 * n_a * n_b * (n_a ** 2 - n_a * n_b + n_b ** 2) / safe_n ** 3
+          + 6 * delta ** 2 * (n_a ** 2 * m2_b + n_b ** 2 * m2_a) / safe_n ** 2
+          + 4 * delta * (n_a * m3_b - n_b * m3_a) / safe_n)
+    return n, mean, m2, m3, m4
+
+
+def _summary_from_moments(columns, n, mean, m2, m3, m4):
+    """Builds count/mean/std/skewness/kurtosis from the central moments (divided by n) of every column."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        std = np.sqrt(m2 * n / (n - 1))
+        g1 = m3 / m2 ** 1.5
+        g2 = m4 / m2 ** 2 - 3
+        skewness = np.where(n > 2, np.sqrt(n * (n - 1)) / (n - 2) * g1, np.nan)
+        kurtosis = np.where(n > 3, ((n + 1) * g2 + 6) * (n - 1) / ((n - 2) * (n - 3)), np.nan)
+        # Constant columns have no spread: pandas reports 0 for both
+        skewness = np.where(m2 == 0, 0.0, skewness)
+        kurtosis = np.where(m2 == 0, 0.0, kurtosis)
+    return pd.DataFrame({"count": n, "mean": mean, "std": std, "skewness": skewness, "kurtosis": kurtosis},
+                        index=pd.Index(columns, name="feature"))
+
+
+def get_statistics(df, bins=30):
+    """
+    Returns compute_statistics(df) from the cache, computing it on first use.
+
+    Entries are keyed by the DataFrame object and dropped when it is garbage collected,
+    so DataFrames must not be modified in place after their statistics were read.
+    """
+    key = (id(df), bins)
+    if key not in _statistics_cache:
+        _statistics_cache[key] = compute_statistics(df, bins=bins)
+        weakref.finalize(df, _statistics_cache.pop, key, None)
+    return _statistics_cache[key]
+
+
+def describe_statistics(df):
+    """describe()-style table (count, mean, std, min, quartiles, max) read from the cached statistics."""
+    return get_statistics(df)["summary"][["count", "mean", "std", "min", "25%", "50%", "75%", "max"]]
+
+
+#------------------------------------------------------------------
+# Period aggregation: rows are grouped on the first day of their period, computed from
+# the datetime64 values with integer arithmetic (no sort, index copy or Period objects).
+REPORTING_FREQUENCIES = ["Day", "Week", "Month", "Quarter"]
+_period_cache = {}
+
+
+def period_starts(dates, reporting_frequency):
+    """
+    Maps dates to the first day of their day, week (Monday), month or quarter, as a
+    datetime64[D] array; missing dates stay NaT.
+    """
+    frequency = reporting_frequency.capitalize()
+    if frequency not in REPORTING_FREQUENCIES:
+        raise ValueError(f"Unsupported reporting frequency '{reporting_frequency}'. "
+                         f"Choose one of: {', '.join(REPORTING_FREQUENCIES)}")
+    days = pd.to_datetime(dates).to_numpy(dtype="datetime64[D]")
+    if frequency == "Day":
+        return days
+    missing = np.isnat(days)
+    if frequency == "Week":
+        ordinals = days.astype(np.int64)
+        starts = (ordinals - (ordinals + 3) % 7).astype("datetime64[D]")  # 1970-01-01 was a Thursday
+    else:
+        months = days.astype("datetime64[M]").astype(np.int64)
+        if frequency == "Quarter":
+            months = months - months % 3
+        starts = months.astype("datetime64[M]").astype("datetime64[D]")
+    starts[missing] = np.datetime64("NaT")
+    return starts
+
+
+def aggregate_by_period(df, date_column="Date Reported", reporting_frequency="Quarter", stats="mean", columns=None):
+    """
+    Aggregates the numeric columns of df per day, week, month or quarter of `date_column`.
+
+    Only the aggregated columns are read; periods without rows are left out. Results are
+    cached per DataFrame and arguments, so switching between e.g. monthly and quarterly
+    views only computes each view once; as with get_statistics, df must not be modified
+    in place afterwards.
+
+    Args:
+        df (pd.DataFrame): Rows to aggregate.
+        date_column (str): Date column to group on.
+        reporting_frequency (str): 'Day', 'Week', 'Month' or 'Quarter'.
+        stats (str or list): One aggregation (flat columns) or several ((column, stat) columns).
+        columns (list, optional): Columns to aggregate; all numeric columns by default.
+
+    Returns:
+        pd.DataFrame: One row per period, indexed by its first day ('<Frequency>_Year').
+    """
+    if columns is None:
+        columns = [column for column in df.columns if column != date_column
+                   and pd.api.types.is_numeric_dtype(df[column]) and not pd.api.types.is_bool_dtype(df[column])]
+    key = (id(df), date_column, reporting_frequency.capitalize(),
+           stats if isinstance(stats, str) else tuple(stats), tuple(columns))
+    if key not in _period_cache:
+        starts = pd.DatetimeIndex(period_starts(df[date_column], reporting_frequency),
+                                  name=reporting_frequency.capitalize() + '_Year')
+        aggregated = df.groupby(starts)[list(columns)].agg(stats if isinstance(stats, str) else list(stats))
+        _period_cache[key] = aggregated
+        weakref.finalize(df, _period_cache.pop, key, None)
+    return _period_cache[key]
+
+
+#------------------------------------------------------------------
+# Out-of-core statistics: mergeable per-column sketches updated one chunk at a time, so
+# the EDA of a dataset that does not fit in memory never holds more than one chunk.
+class QuantileSketch:
+    """
+    KLL-style quantile sketch. Level h holds items of weight 2**h; a level that grows
+    past `k` items is sorted and every other item (from a random offset) is promoted to
+    the next level. The rank error is about n / k per compaction depth.
+    """
+
+    def __init__(self, k=2048, seed=None):
+        self.k = k
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values):
+        self.levels[0] = np.concatenate([self.levels[0], values[~np.isnan(values)]])
+        self._compress()
+
+    def merge(self, other):
+        for level, items in enumerate(other.levels):
+            if level == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self._compress()
+        return self
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self.k:
+                items = np.sort(items)
+                # An odd item out stays at this level
+                kept, paired = items[len(items) - len(items) % 2:], items[:len(items) - len(items) % 2]
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], paired[self._rng.integers(2)::2]])
+                self.levels[level] = kept
+            level += 1
+
+    def quantiles(self, qs):
+        items = np.concatenate(self.levels)
+        if not len(items):
+            return np.full(len(qs), np.nan)
+        weights = np.concatenate([np.full(len(level_items), 2 ** level) for level, level_items in enumerate(self.levels)])
+        order = np.argsort(items, kind="stable")
+        cumulative = np.cumsum(weights[order])
+        ranks = np.searchsorted(cumulative, np.asarray(qs) * cumulative[-1], side="left")
+        return items[order][np.minimum(ranks, len(items) - 1)]
+
+
+class StreamingHistogram:
+    """
+    Equal-width histogram whose range is not known up front: it keeps `bins * resolution`
+    fine bins and doubles their width (towards the side that overflowed) whenever new
+    values fall outside the range. result() trims the empty edges and regroups the fine
+    bins into about `bins` bins.
+    """
+
+    def __init__(self, bins=30, resolution=8):
+        self.bins = bins
+        self.counts = np.zeros(bins * resolution, dtype=np.int64)
+        self.low = None
+        self.width = None
+
+    def update(self, values, weights=None):
+        keep = ~np.isnan(values)
+        values = values[keep]
+        if not len(values):
+            return
+        low, high = values.min(), values.max()
+        if self.low is None:
+            self.low, self.width = low, ((high - low) / len(self.counts)) or 1.0
+        self._cover(low, high)
+        positions = np.minimum(((values - self.low) / self.width).astype(np.int64), len(self.counts) - 1)
+        self.counts += np.bincount(positions, weights=None if weights is None else weights[keep],
+                                   minlength=len(self.counts)).astype(np.int64)
+
+    def merge(self, other):
+        # Re-bins the other histogram's bin centers; exact when the bins line up
+        if other.low is not None:
+            centers = other.low + (np.arange(len(other.counts)) + 0.5) * other.width
+            nonempty = other.counts > 0
+            self.update(centers[nonempty], other.counts[nonempty])
+        return self
+
+    def _cover(self, low, high):
+        size = len(self.counts)
+        while low < self.low or high > self.low + size * self.width:
+            doubled = np.zeros(2 * size, dtype=np.int64)
+            if low < self.low:
+                doubled[size:] = self.counts
+                self.low -= size * self.width
+            else:
+                doubled[:size] = self.counts
+            self.counts = doubled.reshape(size, 2).sum(axis=1)
+            self.width *= 2
+
+    def result(self):
+        """Returns (counts, bin edges) like np.histogram."""
+        nonempty = np.flatnonzero(self.counts)
+        if not len(nonempty):
+            return np.zeros(self.bins, dtype=np.int64), np.linspace(0, 1, self.bins + 1)
+        first, last = nonempty[0], nonempty[-1] + 1
+        factor = -(-(last - first) // self.bins)
+        fine = np.zeros(-(-(last - first) // factor) * factor, dtype=np.int64)
+        fine[:last - first] = self.counts[first:last]
+        counts = fine.reshape(-1, factor).sum(axis=1)
+        return counts, self.low + (first + np.arange(len(counts) + 1) * factor) * self.width
+
+
+class StreamingStatistics:
+    """
+    Chunk-by-chunk equivalent of compute_statistics: moments merged with Chan/Pebay's
+    pairwise update, exact min/max, a QuantileSketch and a StreamingHistogram per
+    numeric column, level counts of the `level_columns` and a uniform random sample of
+    at most `sample_rows` rows (for the plots that need individual rows).
+    """
+
+    def __init__(self, bins=30, quantiles=(0.25, 0.5, 0.75), level_columns=(), sample_rows=50_000,
+                 sketch_size=2048, seed=None):
+        self.bins = bins
+        self.quantile_levels = quantiles
+        self.level_columns = list(level_columns)
+        self.sample_rows = sample_rows
+        self.sketch_size = sketch_size
+        self._rng = np.random.default_rng(seed)
+        self.columns = None
+        self.rows = 0
+        self.levels = {column: pd.Series(dtype=np.int64) for column in self.level_columns}
+        self.sample = None
+        self._sample_keys = np.empty(0)
+
+    def _start(self, columns):
+        self.columns = columns
+        zeros = np.zeros(len(columns))
+        self.n, self.mean, self.m2, self.m3, self.m4 = zeros, zeros.copy(), zeros.copy(), zeros.copy(), zeros.copy()
+        self.minimum, self.maximum = np.full(len(columns), np.inf), np.full(len(columns), -np.inf)
+        self.sketches = [QuantileSketch(self.sketch_size, seed=self._rng.integers(2 ** 32)) for _ in columns]
+        self.histograms = [StreamingHistogram(self.bins) for _ in columns]
+
+    def update(self, chunk):
+        if self.columns is None:
+            self._start([column for column in chunk.columns if column not in self.level_columns
+                         and pd.api.types.is_numeric_dtype(chunk[column]) and not pd.api.types.is_bool_dtype(chunk[column])])
+        values = chunk[self.columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        present = ~np.isnan(values)
+        n = present.sum(axis=0).astype(np.float64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean = np.where(n > 0, np.nansum(values, axis=0) / n, 0.0)
+        centered = np.where(present, values - mean, 0.0)
+        squared = centered ** 2
+        self._merge_moments((n, mean, squared.sum(axis=0), (squared * centered).sum(axis=0), (squared * squared).sum(axis=0)))
+        del centered, squared
+        if len(values):
+            with np.errstate(invalid='ignore'):
+                self.minimum = np.fmin(self.minimum, np.nanmin(np.where(present, values, np.inf), axis=0))
+                self.maximum = np.fmax(self.maximum, np.nanmax(np.where(present, values, -np.inf), axis=0))
+        for i in range(len(self.columns)):
+            self.sketches[i].update(values[:, i])
+            self.histograms[i].update(values[:, i])
+        for column in self.level_columns:
+            self.levels[column] = self.levels[column].add(chunk[column].value_counts(sort=False), fill_value=0)
+        self._update_sample(chunk)
+        self.rows += len(chunk)
+
+    def _merge_moments(self, moments):
+        # Moments are kept as sums of powers of deviations from the mean (see merge_moments)
+        self.n, self.mean, self.m2, self.m3, self.m4 = merge_moments(
+            (self.n, self.mean, self.m2, self.m3, self.m4), moments)
+
+    def _update_sample(self, chunk, keys=None):
+        # Reservoir sample: every row draws a random key, the smallest keys are kept
+        if not self.sample_rows:
+            return
+        keys = self._rng.random(len(chunk)) if keys is None else keys
+        if self.sample is not None:
+            chunk = pd.concat([self.sample, chunk], ignore_index=True)
+            keys = np.concatenate([self._sample_keys, keys])
+        if len(keys) > self.sample_rows:
+            keep = np.sort(np.argpartition(keys, self.sample_rows)[:self.sample_rows])
+            chunk, keys = chunk.iloc[keep].reset_index(drop=True), keys[keep]
+        self.sample, self._sample_keys = chunk, keys
+
+    def merge(self, other):
+        """Adds the statistics of another StreamingStatistics over the same columns."""
+        if other.columns is None:
+            return self
+        if self.columns is None:
+            self._start(other.columns)
+        self._merge_moments((other.n, other.mean, other.m2, other.m3, other.m4))
+        self.minimum, self.maximum = np.fmin(self.minimum, other.minimum), np.fmax(self.maximum, other.maximum)
+        for mine, theirs in zip(self.sketches + self.histograms, other.sketches + other.histograms):
+            mine.merge(theirs)
+        for column in self.level_columns:
+            self.levels[column] = self.levels[column].add(other.levels[column], fill_value=0)
+        if other.sample is not None:
+            self._update_sample(other.sample, other._sample_keys)
+        self.rows += other.rows
+        return self
+
+    def result(self):
+        """
+        Returns the statistics in the layout of compute_statistics, plus "levels"
+        (column -> counts per level) and "sample" (DataFrame of the sampled rows).
+        """
+        columns = self.columns or []
+        if self.columns is None:
+            self._start([])
+        summary = _summary_from_moments(columns, self.n, self.mean, self.m2 / self.n, self.m3 / self.n, self.m4 / self.n)
+        summary["min"] = np.where(self.n > 0, self.minimum, np.nan)
+        summary["max"] = np.where(self.n > 0, self.maximum, np.nan)
+        quantile_values = np.array([sketch.quantiles(self.quantile_levels) for sketch in self.sketches]).reshape(
+            len(columns), len(self.quantile_levels))
+        for q, column in zip(self.quantile_levels, quantile_values.T):
+            summary[f"{q:.0%}"] = column
+        summary = summary[["count", "mean", "std", "skewness", "kurtosis", "min",
+                           *[f"{q:.0%}" for q in self.quantile_levels], "max"]]
+        return {"summary": summary,
+                "histograms": {column: histogram.result() for column, histogram in zip(columns, self.histograms)},
+                "levels": {column: counts.astype(np.int64) for column, counts in self.levels.items()},
+                "sample": self.sample}
+
+
+class StreamingPeriodMeans:
+    """Per-period means of the numeric columns (see aggregate_by_period), accumulated as running sums and counts."""
+
+    def __init__(self, date_column, reporting_frequency):
+        self.date_column = date_column
+        self.reporting_frequency = reporting_frequency
+        self.sums = None
+        self.counts = None
+
+    def update(self, chunk):
+        periods = pd.DatetimeIndex(period_starts(chunk[self.date_column], self.reporting_frequency),
+                                   name=self.reporting_frequency.capitalize() + '_Year')
+        grouped = chunk.drop(columns=self.date_column).groupby(periods)
+        sums, counts = grouped.sum(), grouped.count()
+        self.sums = sums if self.sums is None else self.sums.add(sums, fill_value=0)
+        self.counts = counts if self.counts is None else self.counts.add(counts, fill_value=0)
+
+    def result(self):
+        return (self.sums / self.counts).sort_index()
+
+
+def iter_dataset_chunks(path, chunksize=100_000, columns=None, date_column="Date Reported"):
+    """
+    Yields a dataset in chunks: a CSV file `chunksize` rows at a time, or a partitioned
+    dataset directory (see DataSaver.append_partitions) one part file at a time.
+    """
+    if not os.path.isdir(path):
+        yield from pd.read_csv(path, chunksize=chunksize, usecols=columns, parse_dates=[date_column])
+        return
+    from cyberdatagen import DataSaver
+    saver = DataSaver()
+    for folder, _, names in sorted(os.walk(path)):
+        for name in sorted(names):
+            if name.startswith("part-"):
+                chunk = saver.read_dataframe(os.path.join(folder, name))
+                chunk[date_column] = pd.to_datetime(chunk[date_column])
+                yield chunk if columns is None else chunk[columns]
+
+
+def stream_eda_statistics(chunks, date_column, period_columns, reporting_frequency, level_columns=(), sample_rows=50_000,
+                          seed=None):
+    """
+    Reads `chunks` once and returns (statistics, per-period means of `period_columns`);
+    the statistics are those of StreamingStatistics.result().
+    """
+    stats = StreamingStatistics(level_columns=level_columns, sample_rows=sample_rows, seed=seed)
+    period_means = StreamingPeriodMeans(date_column, reporting_frequency)
+    for chunk in chunks:
+        stats.update(chunk)
+        period_means.update(chunk[[date_column, *period_columns]])
+    return stats.result(), period_means.result()
+
+
+#------------------------------------------------------------------
+# Pre-binned rendering: above this many rows the histograms and boxplots are drawn from
+# the cached statistics (bin counts, quantiles) instead of handing raw columns to seaborn.
+LARGE_DATA_ROWS = 200_000
+
+
+def use_prebinned(df, prebinned=None):
+    return len(df) > LARGE_DATA_ROWS if prebinned is None else prebinned
+
+
+def kde_from_histogram(counts, edges, std, grid_size=200):
+    """
+    Gaussian KDE evaluated on a fixed grid from binned counts, on the count scale of
+    the histogram, so the cost depends on the number of bins, not on the number of rows.
+
+    The bandwidth follows Scott's rule on the column's standard deviation, widened by
+    the spread of values within a bin.
+    """
+    n = counts.sum()
+    width = edges[1] - edges[0]
+    if n < 2 or not np.isfinite(std) or std == 0 or width == 0:
+        return None, None
+    bandwidth = np.sqrt((1.06 * std * n ** (-1 / 5)) ** 2 + width ** 2 / 12)
+    centers = (edges[:-1] + edges[1:]) / 2
+    grid = np.linspace(edges[0], edges[-1], grid_size)
+    density = np.exp(-0.5 * ((grid[:, None] - centers[None, :]) / bandwidth) ** 2) @ counts
+    density /= bandwidth * np.sqrt(2 * np.pi)
+    return grid, density * width
+
+
+def level_values(df, feature, stats):
+    """
+    Values that tell whether a column holds labels: the levels counted in stats["levels"]
+    when present (so pre-binned plots need no rows), else the column itself.
+    """
+    levels = stats.get("levels", {}).get(feature)
+    return df[feature] if levels is None else pd.Series(levels.index[levels.to_numpy() > 0], dtype=object)
+
+
+def plot_level_counts(ax, series, palette, counts=None):
+    """Bar chart of the counts of every level of a label column (e.g. risk levels), or of precomputed `counts`."""
+    counts = series.value_counts(sort=False) if counts is None else counts
+    counts = counts[[level for level in palette if level in counts.index]]
+    ax.bar(counts.index.astype(str), counts.to_numpy(), color=[palette[level] for level in counts.index])
+
+
+def plot_prebinned_histogram(ax, counts, edges, std):
+    """Draws a histogram and its KDE from precomputed bin counts."""
+    ax.stairs(counts, edges, fill=True, alpha=0.6)
+    grid, density = kde_from_histogram(counts, edges, std)
+    if grid is not None:
+        ax.plot(grid, density)
+
+
+def plot_prebinned_boxplot(ax, summary_row):
+    """
+    Draws a boxplot from precomputed quartiles. The whiskers end at 1.5 IQR from the box,
+    clipped to the column's range (the most extreme values inside would need another pass);
+    outliers are not drawn.
+    """
+    iqr = summary_row['75%'] - summary_row['25%']
+    box = {"med": summary_row['50%'], "q1": summary_row['25%'], "q3": summary_row['75%'],
+           "whislo": max(summary_row['min'], summary_row['25%'] - 1.5 * iqr),
+           "whishi": min(summary_row['max'], summary_row['75%'] + 1.5 * iqr), "fliers": []}
+    ax.bxp([box], showfliers=False, widths=0.5)
+    ax.set_xticks([])
+
+
+def statistics_text(summary_row):
+    return (f"Mean: {summary_row['mean']:.4f}\n"
+            f"Std Dev: {summary_row['std']:.4f}\n"
+            f"Skewness: {summary_row['skewness']:.4f}\n"
+            f"Kurtosis: {summary_row['kurtosis']:.4f}")
+
+
+#------------------------------------------------------------------
+def finish_figure(fig, show=True):
+    """Shows the figure (interactive use), or returns it without showing, e.g. to be saved."""
+    if show:
+        plt.show()
+        return None
+    return fig
+
+
+def plot_numerical_features_daily_values(df, date_column, feature_columns, rows, cols, show=True):
 
     fig, axes = plt.subplots(rows, cols, figsize=(16, 8))
     axes = axes.flatten()  # Flatten the 2D array of axes for easier iteration
@@ -46,14 +591,16 @@ def plot_numerical_features_daily_values(df, date_column, feature_columns, rows,
         axes[j].set_visible(False)
 
     plt.tight_layout()
-    plt.show()
+    return finish_figure(fig, show)
 
 
 #------------------------------------------------------------------
 
-def daily_distribution_of_activity_features_pipeline(df):
+def daily_distribution_of_activity_features_pipeline(df, show=True):
     """
     Pipeline to plot daily distribution of numerical features.
+
+    With show=False the figures are returned (raw values, normalized values) instead of shown.
     """
     features = df.columns.tolist()
     n_features = len(features)
@@ -61,17 +608,31 @@ def daily_distribution_of_activity_features_pipeline(df):
     cols =  int(n_features/2)
 
     print("Non normalized daily distribution")
-    plot_numerical_features_daily_values(df, "Date Reported", features, rows, cols)
+    raw_figure = plot_numerical_features_daily_values(df, "Date Reported", features, rows, cols, show)
     #plot_numerical_features_daily_values(df)
     print("Normalized daily distribution")
     df_normalized = normalize_numerical_features(df)
     #plot_numerical_features_daily_values(df_normalized)
-    plot_numerical_features_daily_values(df_normalized, "Date Reported", features, rows, cols)
+    normalized_figure = plot_numerical_features_daily_values(df_normalized, "Date Reported", features, rows, cols, show)
+    return None if show else [raw_figure, normalized_figure]
 #-------------------------------------------------------------------------
 
-def plot_histograms(df):
+def is_risk_level_feature(series, risk_palette):
+    """
+    Checks whether a feature holds risk labels (object or categorical dtype) covered by the palette.
+    """
+    if not (series.dtype == 'object' or isinstance(series.dtype, pd.CategoricalDtype)):
+        return False
+    return set(series.dropna().unique()).issubset(risk_palette.keys())
+
+
+def plot_histograms(df, stats=None, prebinned=None, show=True):
     """
     Plots histograms for all features in the list with risk level and displays basic statistics.
+
+    The statistics are read from `stats` (see get_statistics), by default those of df.
+    With `prebinned` (default: more than LARGE_DATA_ROWS rows) the histograms and KDEs
+    are drawn from the cached bin counts.
     """
     # Define the risk palette
     risk_palette = {
@@ -81,6 +642,9 @@ def plot_histograms(df):
                     'Critical': 'red'
                    }
 
+    stats = stats if stats is not None else get_statistics(df)
+    summary = stats["summary"]
+    prebinned = use_prebinned(df, prebinned)
     features = df.columns.tolist()
     n_features = len(features)
     n_cols = int(n_features/2)
@@ -92,7 +656,11 @@ def plot_histograms(df):
 
     for i, feature in enumerate(features):
         #sns.histplot(df[feature], bins=30, kde=True, ax=axes[i])
-        if df[feature].dtype == 'object' and set(df[feature].unique()).issubset(risk_palette.keys()):
+        if prebinned and is_risk_level_feature(level_values(df, feature, stats), risk_palette):
+            plot_level_counts(axes[i], df[feature], risk_palette, stats.get("levels", {}).get(feature))
+        elif prebinned and feature in stats["histograms"]:
+            plot_prebinned_histogram(axes[i], *stats["histograms"][feature], summary.loc[feature, 'std'])
+        elif is_risk_level_feature(df[feature], risk_palette):
             sns.histplot(df[feature], palette=risk_palette, ax=axes[i])
         else:
             sns.histplot(df[feature], bins=30, kde=True, ax=axes[i])
@@ -101,20 +669,9 @@ def plot_histograms(df):
         axes[i].set_xlabel(feature)
         axes[i].set_ylabel('Frequency')
 
-        # Calculate and display statistics for numeric features
-        if np.issubdtype(df[feature].dtype, np.number):
-            mean_return = df[feature].mean()
-            std_dev = df[feature].std()
-            skewness = df[feature].skew()
-            kurtosis = df[feature].kurtosis()
-
-            # Calculate and display statistics for numeric features
-        if np.issubdtype(df[feature].dtype, np.number):
-            statistics = (f"Mean: {mean_return:.4f}\n"
-                      f"Std Dev: {std_dev:.4f}\n"
-                      f"Skewness: {skewness:.4f}\n"
-                      f"Kurtosis: {kurtosis:.4f}")
-            axes[i].text(0.35, -0.18, statistics, transform=axes[i].transAxes,
+        # Display statistics for numeric features
+        if feature in summary.index:
+            axes[i].text(0.35, -0.18, statistics_text(summary.loc[feature]), transform=axes[i].transAxes,
                      fontsize=10, verticalalignment='top',
                      bbox=dict(boxstyle="round,pad=0.3", edgecolor="black", facecolor="lightgrey"))
 
@@ -125,11 +682,15 @@ def plot_histograms(df):
 
     #plt.tight_layout()
     plt.tight_layout(rect=[0, 0.05, 1, 1])  # Add padding to the bottom
-    plt.show()
+    return finish_figure(fig, show)
 
-def plot_boxplots(df):
+def plot_boxplots(df, stats=None, prebinned=None, show=True):
     """
     Plots boxplots for all features in the list and displays basic statistics.
+
+    The statistics are read from `stats` (see get_statistics), by default those of df.
+    With `prebinned` (default: more than LARGE_DATA_ROWS rows) the boxes are drawn from
+    the cached quartiles and label columns as level counts.
     """
     # Define the risk palette
     risk_palette = {
@@ -139,6 +700,9 @@ def plot_boxplots(df):
                     'Critical': 'red'
                    }
 
+    stats = stats if stats is not None else get_statistics(df)
+    summary = stats["summary"]
+    prebinned = use_prebinned(df, prebinned)
     features  = df.columns.tolist()
     n_features = len(features)
     n_cols = int(n_features/2)
@@ -151,7 +715,11 @@ def plot_boxplots(df):
     for i, feature in enumerate(features):
         #sns.boxplot(y=df[feature], ax=axes[i])
         # Check if the feature has risk levels
-        if df[feature].dtype == 'object' and set(df[feature].unique()).issubset(risk_palette.keys()):
+        if prebinned and is_risk_level_feature(level_values(df, feature, stats), risk_palette):
+            plot_level_counts(axes[i], df[feature], risk_palette, stats.get("levels", {}).get(feature))
+        elif prebinned and feature in summary.index:
+            plot_prebinned_boxplot(axes[i], summary.loc[feature])
+        elif is_risk_level_feature(df[feature], risk_palette):
             sns.boxplot(y=df[feature], palette=risk_palette, ax=axes[i])
         else:
             sns.boxplot(y=df[feature], ax=axes[i])
@@ -159,19 +727,9 @@ def plot_boxplots(df):
         axes[i].set_title(f'Boxplot of {feature}')
         axes[i].set_ylabel(feature)
 
-        # Calculate and display statistics for numeric features
-        if np.issubdtype(df[feature].dtype, np.number):
-            mean_return = df[feature].mean()
-            std_dev = df[feature].std()
-            skewness = df[feature].skew()
-            kurtosis = df[feature].kurtosis()
-
-            # Add statistics below the plot
-            statistics = (f"Mean: {mean_return:.4f}\n"
-                      f"Std Dev: {std_dev:.4f}\n"
-                      f"Skewness: {skewness:.4f}\n"
-                      f"Kurtosis: {kurtosis:.4f}")
-            axes[i].text(0.35, -0.18, statistics, transform=axes[i].transAxes,
+        # Add statistics below the plot for numeric features
+        if feature in summary.index:
+            axes[i].text(0.35, -0.18, statistics_text(summary.loc[feature]), transform=axes[i].transAxes,
                      fontsize=10, verticalalignment='top',
                      bbox=dict(boxstyle="round,pad=0.3", edgecolor="black", facecolor="lightgrey"))
 
@@ -181,26 +739,31 @@ def plot_boxplots(df):
 
     #plt.tight_layout()
     plt.tight_layout(rect=[0, 0.05, 1, 1])  # Add padding to the bottom
-    plt.show()
+    return finish_figure(fig, show)
 #-----------------------------------------------------------------------------------------------------
 
-def visualize_form_of_activity_features_distribution(df):
+def visualize_form_of_activity_features_distribution(df, stats=None, prebinned=None, show=True):
     """
     Master function to plot histograms and boxplots for all features, with statistics.
+
+    With show=False the figures are returned (histograms, boxplots) instead of shown.
     """
+    stats = stats if stats is not None else get_statistics(df)
     sns.set(style="whitegrid")
     print("Plotting histograms...")
-    plot_histograms(df)
+    histograms_figure = plot_histograms(df, stats, prebinned, show)
 
     print("Plotting boxplots...")
-    plot_boxplots(df)
+    boxplots_figure = plot_boxplots(df, stats, prebinned, show)
+    return None if show else [histograms_figure, boxplots_figure]
 
 
 def plot_scatter(axes, x, y, hue, df, palette, title, xlabel, ylabel, legend_title, ax_index):
     """
     Creates a scatter plot on the specified axis.
     """
-    sns.scatterplot(x=x, y=y, hue=hue, data=df, palette=palette, ax=axes[ax_index])
+    # Rasterized points keep vector (SVG) exports small and fast to write on large datasets
+    sns.scatterplot(x=x, y=y, hue=hue, data=df, palette=palette, ax=axes[ax_index], rasterized=True)
     axes[ax_index].set_title(title)
     axes[ax_index].set_xlabel(xlabel)
     axes[ax_index].set_ylabel(ylabel)
@@ -224,7 +787,7 @@ def plot_correlation_heatmap(axes, df, features, ax_index):
     #axes[ax_index].set_title("Correlation Heatmap")
 
 
-def combines_user_activities_scatter_plots_and_heatmap(scatter_df, df):
+def combines_user_activities_scatter_plots_and_heatmap(scatter_df, df, show=True):
     """
     Combines scatter plots and heatmap into a single figure using subplots.
     """
@@ -270,16 +833,28 @@ def combines_user_activities_scatter_plots_and_heatmap(scatter_df, df):
 
     # Adjust layout and show plot
     plt.tight_layout()
-    plt.show()
+    return finish_figure(fig, show)
 
 #-----------------------------------------Main EDA pipeline------------------------------------------------------
-def explaratory_data_analysis_pipeline(df=None):
+def prepare_eda_inputs(df=None, path=None, chunksize=None, reporting_frequency='Quarter'):
+    """
+    Loads (or streams) the dataset and returns everything the EDA figures are drawn from:
+    "period_means", "activity", "scatter", "stats" and "prebinned".
+
+    With `chunksize`, or when `path` is a partitioned dataset directory, the dataset is
+    never loaded as a whole: it is read once in chunks into streaming sketches (see
+    stream_eda_statistics). The period table, histograms and boxplots come from the
+    sketches; the scatter plots and heatmap are drawn from a uniform sample of rows.
 
-    if df is None:
-        file_path_to_normal_and_anomalous_google_drive = \
-                        "/content/drive/My Drive/Cybersecurity Data/normal_and_anomalous_cybersecurity_dataset_for_google_drive_kb.csv"
+    The period table holds the mean of every feature per `reporting_frequency`
+    ('Day', 'Week', 'Month' or 'Quarter', see aggregate_by_period).
+    """
+    if df is None and path is None:
+        path = "/content/drive/My Drive/Cybersecurity Data/normal_and_anomalous_cybersecurity_dataset_for_google_drive_kb.csv"
+    streaming = df is None and (chunksize is not None or os.path.isdir(path))
+    if df is None and not streaming:
         #load real_world_simulated_normal_and_anomalous_df
-        df = pd.read_csv(file_path_to_normal_and_anomalous_google_drive)
+        df = pd.read_csv(path)
 
     eda_features =  [
     "Date Reported", "Issue Response Time Days", "Impact Score", "Cost",
@@ -294,37 +869,140 @@ def explaratory_data_analysis_pipeline(df=None):
     ]
  
 
-    reporting_frequency = 'Quarter'
-    frequency = reporting_frequency[0].upper()
-    if reporting_frequency.capitalize() == 'Month' or reporting_frequency.capitalize() == 'Quarter':
-        frequency_date_column = reporting_frequency.capitalize() + '_Year'
-
-    frequency_date_column = reporting_frequency.capitalize() + '_Year'
-    eda_features_df = df[eda_features].copy()
-    eda_features_df = eda_features_df.set_index("Date Reported")
-
-    freq_eda_features_df = eda_features_df.copy()
-
-    freq_eda_features_df[frequency_date_column] = pd.to_datetime(freq_eda_features_df.index)
-    freq_eda_features_df[frequency_date_column] =  freq_eda_features_df[frequency_date_column].dt.to_period(frequency)
-
-    freq_eda_features_df = freq_eda_features_df.groupby(frequency_date_column).mean()
-    #df['Date Reported'] = df['Date Reported'].dt.to_timestamp()
-    freq_eda_features_df.index = freq_eda_features_df.index.to_timestamp()
-    display(freq_eda_features_df)
+    scatter_features = ["Session Duration in Second", "Login Attempts", "Data Transfer MB", "User Location"]
 
+    if streaming:
+        columns = list(dict.fromkeys(eda_features + activity_features + scatter_features))
+        stats, freq_eda_features_df = stream_eda_statistics(
+            iter_dataset_chunks(path, chunksize or 100_000, columns), "Date Reported", eda_features[1:], reporting_frequency,
+            level_columns=["Risk Level", "Threat Level"])
+        return {"period_means": freq_eda_features_df, "activity": stats["sample"][activity_features].copy(),
+                "scatter": stats["sample"][scatter_features].copy(), "stats": stats, "prebinned": True}
 
+    freq_eda_features_df = aggregate_by_period(df, "Date Reported", reporting_frequency, columns=eda_features[1:])
     activity_features_df = df[activity_features].copy()
 
     scatter_plot_features_df = df[["Session Duration in Second", "Login Attempts",
                                   "Data Transfer MB", "User Location"]].copy()
+    # Statistics of the full dataset (cached, e.g. already computed by DataDisplay) cover the activity features
+    return {"period_means": freq_eda_features_df, "activity": activity_features_df, "scatter": scatter_plot_features_df,
+            "stats": get_statistics(df), "prebinned": None}
+
+
+def explaratory_data_analysis_pipeline(df=None, path=None, chunksize=None, reporting_frequency='Quarter'):
+    """
+    Runs the EDA on `df`, or on the dataset at `path` (by default the combined CSV on Google Drive),
+    and shows its figures. See prepare_eda_inputs for the out-of-core mode and the reporting frequency.
+    """
+    inputs = prepare_eda_inputs(df, path, chunksize, reporting_frequency)
+    freq_eda_features_df = inputs["period_means"]
+    display(freq_eda_features_df)
 
     #daily_distribution_of_activity_features_pipeline(eda_features_df )
     daily_distribution_of_activity_features_pipeline(freq_eda_features_df )
-    visualize_form_of_activity_features_distribution(activity_features_df)
-    combines_user_activities_scatter_plots_and_heatmap(scatter_plot_features_df, activity_features_df)
+    visualize_form_of_activity_features_distribution(inputs["activity"], inputs["stats"], inputs["prebinned"])
+    combines_user_activities_scatter_plots_and_heatmap(inputs["scatter"], inputs["activity"])
     return freq_eda_features_df
 
+
+#------------------------------------------------------------------
+# Figure export: every figure group is drawn off-screen (Agg) in its own worker process
+# and written to files, for headless batch runs.
+FIGURE_GROUPS = {
+    "daily_distributions": ("daily_distribution", "daily_distribution_normalized"),
+    "histograms": ("histograms",),
+    "boxplots": ("boxplots",),
+    "scatter_heatmap": ("scatter_heatmap",),
+}
+
+
+def figure_group_inputs(group, inputs):
+    """
+    The part of prepare_eda_inputs' result that one figure group draws from, so a worker
+    only receives what it uses: the period table, the scatter/heatmap columns, or for
+    pre-binned histograms and boxplots the statistics, label level counts and no rows.
+    """
+    if group == "daily_distributions":
+        return {"period_means": inputs["period_means"]}
+    if group == "scatter_heatmap":
+        return {"scatter": inputs["scatter"], "activity": inputs["activity"]}
+    activity, stats = inputs["activity"], inputs["stats"]
+    stats = {key: value for key, value in stats.items() if key != "sample"}
+    if not use_prebinned(activity, inputs["prebinned"]):
+        return {"activity": activity, "stats": stats, "prebinned": False}
+    levels = {column: activity[column].value_counts(sort=False) for column in activity.columns
+              if column not in stats["summary"].index}
+    return {"activity": activity.iloc[:0], "stats": {**stats, "levels": {**levels, **stats.get("levels", {})}},
+            "prebinned": True}
+
+
+def render_figure_group(group, inputs, output_dir, formats=("png",), dpi=100):
+    """
+    Draws one of FIGURE_GROUPS without showing it, writes every figure to
+    output_dir/<name>.<format> and returns the written paths.
+    """
+    if group == "daily_distributions":
+        figures = daily_distribution_of_activity_features_pipeline(inputs["period_means"], show=False)
+    elif group == "scatter_heatmap":
+        figures = [combines_user_activities_scatter_plots_and_heatmap(inputs["scatter"], inputs["activity"], show=False)]
+    else:
+        sns.set(style="whitegrid")
+        plot = plot_histograms if group == "histograms" else plot_boxplots
+        figures = [plot(inputs["activity"], inputs["stats"], inputs["prebinned"], show=False)]
+
+    paths = []
+    for name, fig in zip(FIGURE_GROUPS[group], figures):
+        for file_format in formats:
+            path = os.path.join(output_dir, f"{name}.{file_format}")
+            fig.savefig(path, format=file_format, dpi=dpi)
+            paths.append(path)
+        plt.close(fig)
+    return paths
+
+
+def export_figures(output_dir, df=None, path=None, chunksize=None, reporting_frequency='Quarter', formats=("png",),
+                   groups=None, workers=None, dpi=100):
+    """
+    Runs the EDA without a display: the inputs are prepared once (see prepare_eda_inputs),
+    then each figure group is rendered with the Agg backend in a process pool and saved
+    as PNG and/or SVG. The period table is written as period_means.csv.
+
+    Args:
+        output_dir (str): Folder for the files (created if missing).
+        formats (tuple): File formats, e.g. ("png", "svg").
+        groups (list, optional): Subset of FIGURE_GROUPS; all by default.
+        workers (int, optional): Worker processes (default one per group, at most one per CPU);
+            1 renders in this process, switching pyplot to Agg meanwhile (which closes open figures).
+
+    Returns:
+        list: Paths of the written files.
+    """
+    groups = list(FIGURE_GROUPS) if groups is None else list(groups)
+    unknown = set(groups) - set(FIGURE_GROUPS)
+    if unknown:
+        raise ValueError(f"Unknown figure groups {sorted(unknown)}. Choose from: {', '.join(FIGURE_GROUPS)}")
+    os.makedirs(output_dir, exist_ok=True)
+    inputs = prepare_eda_inputs(df, path, chunksize, reporting_frequency)
+    table_path = os.path.join(output_dir, "period_means.csv")
+    inputs["period_means"].to_csv(table_path)
+    tasks = [(group, figure_group_inputs(group, inputs)) for group in groups]
+
+    workers = workers or min(len(groups), os.cpu_count() or 1)
+    if workers == 1:
+        backend = plt.get_backend()
+        plt.switch_backend("Agg")
+        try:
+            results = [render_figure_group(group, group_inputs, output_dir, formats, dpi) for group, group_inputs in tasks]
+        finally:
+            plt.switch_backend(backend)
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=plt.switch_backend,
+                                 initargs=("Agg",)) as executor:
+            futures = [executor.submit(render_figure_group, group, group_inputs, output_dir, formats, dpi)
+                       for group, group_inputs in tasks]
+            results = [future.result() for future in futures]
+    return [table_path] + [path for paths in results for path in paths]
+
 if __name__ == "__main__":
 
     real_world_normal_and_anomalous_df = explaratory_data_analysis_pipeline()
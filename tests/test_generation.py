@@ -0,0 +1,51 @@
+import json
+import os
+import sys
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cyberdatagen import DataConfig, DataGenerator
+
+
+def test_format_issue_ids_empty():
+    ids, keys = DataConfig().format_issue_ids([])
+    assert len(ids) == 0 and len(keys) == 0
+
+
+def test_zero_anomalies():
+    config = DataConfig(seed=1, num_normal_issues=50, num_anomalous_issues=0)
+    normal_df, anomaly_df, combined_df = DataGenerator(config).data_generation_pipeline()
+    assert len(normal_df) == 50 and len(anomaly_df) == 0 and len(combined_df) == 50
+
+
+def test_chunks_smaller_than_the_normal_anomalous_split():
+    config = DataConfig(seed=1, num_normal_issues=40, num_anomalous_issues=10)
+    combined_df = pd.concat(list(DataGenerator(config).generate_chunks(3)), ignore_index=True)
+    assert len(combined_df) == 50
+    assert combined_df["Issue ID"].is_unique
+    assert combined_df["Is Anomaly"].sum() == 10
+
+
+def test_increments_keep_the_daily_rates(tmp_path):
+    config = DataConfig(seed=3, num_normal_issues=300, num_anomalous_issues=11,
+                        start_date=datetime(2024, 1, 1), end_date=datetime(2024, 1, 31))
+    path = str(tmp_path / "state.json")
+    DataGenerator(config).save_state(path)
+    anomalies = 0
+    for days in [2] + [1] * 9:
+        generator = DataGenerator.from_state(path, days, config)
+        anomalies += generator.config.num_anomalous_issues
+        generator.save_state(path)
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f)["anomalous_issues_per_day"] == 11 / 30
+    assert anomalies == 4
+
+
+def test_compact_dtypes_round_login_attempts():
+    compact = DataGenerator(DataConfig(seed=7)).data_generation_pipeline()[2]
+    full = DataGenerator(DataConfig(seed=7, compact_dtypes=False)).data_generation_pipeline()[2]
+    assert (compact["Login Attempts"].to_numpy() == np.rint(full["Login Attempts"].to_numpy())).all()